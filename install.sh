@@ -142,49 +142,61 @@ THEMES_DIR="$HOME/.config/omarchy/themes"
 GENERATOR="$THEMES_DIR/theme_generator.py"
 # Note: Path will be determined dynamically by CLI tool
 
+# Print the path of a project script (e.g. theme_sync.py) from the installed locations
+find_project_script() {
+    local location
+    for location in \
+        "$THEMES_DIR/../../../projects/omarchy-ide-theme-sync/src/$1" \
+        "$HOME/.local/share/omarchy-ide-theme-sync/src/$1"; do
+        if [[ -f "$location" ]]; then
+            echo "$location"
+            return 0
+        fi
+    done
+    return 1
+}
+
 case "$1" in
     generate)
         if [[ -z "$2" ]]; then
-            echo "Usage: omarchy-theme-sync generate <theme-name>"
+            echo "Usage: omarchy-theme-sync generate <theme-name> [--force]"
             exit 1
         fi
-        python3 "$GENERATOR" generate "$2"
+        python3 "$GENERATOR" generate "${@:2}"
         ;;
     generate-all)
-        python3 "$GENERATOR" generate-all
+        python3 "$GENERATOR" generate-all "${@:2}"
         ;;
     status)
         python3 "$GENERATOR" status
         ;;
     apply)
-        # Look for sync script in installed locations
-        SYNC_LOCATIONS=(
-            "$THEMES_DIR/../../../projects/omarchy-ide-theme-sync/src/theme_sync.py"
-            "$HOME/.local/share/omarchy-ide-theme-sync/src/theme_sync.py"
-        )
-        
-        SYNC_SCRIPT=""
-        for location in "${SYNC_LOCATIONS[@]}"; do
-            if [[ -f "$location" ]]; then
-                SYNC_SCRIPT="$location"
-                break
-            fi
-        done
-        
-        if [[ -n "$SYNC_SCRIPT" ]]; then
-            python3 "$SYNC_SCRIPT" "$2"
+        if SYNC_SCRIPT=$(find_project_script theme_sync.py); then
+            python3 "$SYNC_SCRIPT" "${@:2}"
         else
             echo "Warning: Theme sync script not found - themes generated but not applied"
         fi
         ;;
+    refresh-script)
+        if HOOKS_SCRIPT=$(find_project_script integration_hooks.py); then
+            python3 "$HOOKS_SCRIPT" refresh-script
+        else
+            echo "Error: integration_hooks.py not found - re-run install.sh from the project checkout"
+            exit 1
+        fi
+        ;;
     *)
         echo "Omarchy IDE Theme Sync CLI"
         echo ""
         echo "Usage:"
         echo "  omarchy-theme-sync generate <theme-name>  Generate themes for specific theme"
         echo "  omarchy-theme-sync generate-all           Generate themes for all themes"
+        echo "    --force                                 Regenerate even if alacritty.toml is unchanged"
         echo "  omarchy-theme-sync status                 Check status of all themes"
         echo "  omarchy-theme-sync apply [theme-name]     Apply themes to editors"
+        echo "    --symlink                               Link settings.json to the theme from now on"
+        echo "    --copy                                  Copy the theme into settings.json again (default)"
+        echo "  omarchy-theme-sync refresh-script         Re-detect helpers used by omarchy-theme-set"
         echo ""
         ;;
 esac
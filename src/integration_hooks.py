@@ -4,112 +4,56 @@ Omarchy Integration Hooks
 Provides system integration for automatic theme synchronization
 """
 
+import errno
+import fcntl
+import functools
+import hashlib
 import os
+import shlex
+import shutil
+import stat
 import sys
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 
-class OmarchyIntegration:
-    """Handles integration with the Omarchy theming system"""
-    
-    def __init__(self):
-        self.omarchy_bin_dir = Path.home() / '.local' / 'share' / 'omarchy' / 'bin'
-        self.themes_dir = Path.home() / '.config' / 'omarchy' / 'themes'
-        self.project_dir = Path(__file__).parent.parent
-        
-        # Ensure directories exist
-        self.omarchy_bin_dir.mkdir(parents=True, exist_ok=True)
-        self.themes_dir.mkdir(parents=True, exist_ok=True)
-    
-    def setup_integration(self) -> bool:
-        """Set up integration with Omarchy system"""
-        print("🔧 Setting up Omarchy IDE Theme Sync integration...")
-        
-        success = True
-        
-        # Install theme generator
-        if not self._install_theme_generator():
-            success = False
-        
-        # Setup theme switching hooks
-        if not self._setup_theme_switching_hooks():
-            success = False
-        
-        # Setup theme installation hooks
-        if not self._setup_theme_installation_hooks():
-            success = False
-        
-        if success:
-            print("✅ Integration setup complete!")
-            print("\n🎉 Your VS Code and Cursor will now automatically sync with Omarchy themes!")
-            print("\nUsage:")
-            print("  omarchy-theme-set <theme-name>  # Themes will auto-sync")
-            print("  omarchy-theme-install <url>     # New themes will auto-generate editor themes")
-        else:
-            print("❌ Integration setup failed. Check errors above.")
-        
-        return success
-    
-    def _install_theme_generator(self) -> bool:
-        """Install the theme generator to the themes directory"""
-        try:
-            import shutil
-            
-            # Install the theme generator (main one)
-            comprehensive_source = self.project_dir / 'src' / 'theme_generator.py'
-            comprehensive_dest = self.themes_dir / 'theme_generator.py'
-            
-            if comprehensive_source.exists():
-                shutil.copy2(comprehensive_source, comprehensive_dest)
-                comprehensive_dest.chmod(0o755)
-                print(f"✓ Installed theme generator: {comprehensive_dest}")
-            else:
-                print(f"❌ Theme generator not found: {comprehensive_source}")
-                return False
-            
+# Locations are fixed for the life of the process, so resolve them once
+HOME_DIR = Path.home()
+OMARCHY_BIN_DIR = HOME_DIR / '.local' / 'share' / 'omarchy' / 'bin'
+THEMES_DIR = HOME_DIR / '.config' / 'omarchy' / 'themes'
+PROJECT_DIR = Path(__file__).parent.parent
 
-            
-            return True
-            
-        except Exception as e:
-            print(f"❌ Failed to install theme generators: {e}")
-            return False
-    
-    def _setup_theme_switching_hooks(self) -> bool:
-        """Setup hooks for theme switching"""
-        try:
-            # Backup original omarchy-theme-set if it exists
-            original_script = self.omarchy_bin_dir / 'omarchy-theme-set'
-            backup_script = self.omarchy_bin_dir / 'omarchy-theme-set.backup'
-            
-            if original_script.exists() and not backup_script.exists():
-                import shutil
-                shutil.copy2(original_script, backup_script)
-                print(f"✓ Backed up original theme script: {backup_script}")
-            
-            # Create enhanced theme switcher
-            enhanced_script = self._create_enhanced_theme_switcher()
-            if enhanced_script:
-                print(f"✓ Created enhanced theme switcher: {enhanced_script}")
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            print(f"❌ Failed to setup theme switching hooks: {e}")
-            return False
-    
-    def _create_enhanced_theme_switcher(self) -> Optional[Path]:
-        """Create the enhanced omarchy-theme-set script"""
-        script_path = self.omarchy_bin_dir / 'omarchy-theme-set-enhanced'
-        
-        script_content = '''#!/bin/bash
+COPY_BLOCKSIZE = 1 << 20
+
+# Records a hash of what the last successful setup installed
+FINGERPRINT_FILENAME = '.sync-fingerprint'
+
+# ioctl request for a copy-on-write clone (btrfs/xfs); only exported by fcntl on 3.12+
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+# Helpers the switcher calls, resolved once at install time: (script variable, command)
+RESOLVED_HELPERS = (
+    ('CHROMIUM_BIN', 'chromium'),
+    ('WAYBAR_RESTART_BIN', 'omarchy-restart-waybar'),
+    ('SWAYOSD_RESTART_BIN', 'omarchy-restart-swayosd'),
+    ('MAKOCTL_BIN', 'makoctl'),
+    ('HYPRCTL_BIN', 'hyprctl'),
+    ('THEME_BG_NEXT_BIN', 'omarchy-theme-bg-next'),
+)
+
+# Generated omarchy-theme-set replacement; @RESOLVED_HELPERS@ is filled in by the installer
+ENHANCED_SCRIPT = '''#!/bin/bash
 
 # Enhanced omarchy-theme-set with automatic IDE theme synchronization
 # Part of Omarchy IDE Theme Sync
 
+# Helper paths resolved when the integration was set up (empty = not installed).
+# Re-run 'omarchy-theme-sync refresh-script' after installing new helpers.
+@RESOLVED_HELPERS@
+
 if [[ -z "$1" && "$1" != "CNCLD" ]]; then
     echo "Usage: omarchy-theme-set-enhanced <theme-name>" >&2
     exit 1
@@ -118,7 +62,11 @@ fi
 THEMES_DIR="$HOME/.config/omarchy/themes/"
 CURRENT_THEME_DIR="$HOME/.config/omarchy/current/theme"
 
-THEME_NAME=$(echo "$1" | sed -E 's/<[^>]+>//g' | tr '[:upper:]' '[:lower:]' | tr ' ' '-')
+# Strip markup tags, lowercase and hyphenate using builtins only (no sed/tr forks)
+shopt -s extglob
+THEME_NAME="${1//<+([^>])>/}"
+THEME_NAME="${THEME_NAME,,}"
+THEME_NAME="${THEME_NAME// /-}"
 THEME_PATH="$THEMES_DIR/$THEME_NAME"
 
 # Check if the theme exists
@@ -137,8 +85,7 @@ if [[ ! -f "$THEME_PATH/$THEME_NAME-theme-sync.json" ]]; then
     echo "🔧 Generating IDE themes for $THEME_NAME..."
     
     if [[ -f "$THEMES_DIR/theme_generator.py" ]]; then
-        cd "$THEMES_DIR"
-        if python3 theme_generator.py generate "$THEME_NAME"; then
+        if python3 "$THEMES_DIR/theme_generator.py" generate "$THEME_NAME"; then
             echo "✅ Successfully generated IDE themes for $THEME_NAME"
         else
             echo "⚠️ Failed to generate IDE themes for $THEME_NAME"
@@ -148,44 +95,65 @@ if [[ ! -f "$THEME_PATH/$THEME_NAME-theme-sync.json" ]]; then
     fi
 fi
 
+# Read the current theme's marker files once for all the settings below
+IS_LIGHT=0
+[[ -f "$CURRENT_THEME_DIR/light.mode" ]] && IS_LIGHT=1
+ICONS_THEME=""
+[[ -f "$CURRENT_THEME_DIR/icons.theme" ]] && ICONS_THEME="$(<"$CURRENT_THEME_DIR/icons.theme")"
+CHROMIUM_THEME=""
+[[ -f "$CURRENT_THEME_DIR/chromium.theme" ]] && CHROMIUM_THEME="$(<"$CURRENT_THEME_DIR/chromium.theme")"
+
 # Apply Gnome settings (from original omarchy-theme-set)
-if [[ -f ~/.config/omarchy/current/theme/light.mode ]]; then
-    gsettings set org.gnome.desktop.interface color-scheme "prefer-light" 2>/dev/null || true
-    gsettings set org.gnome.desktop.interface gtk-theme "Adwaita" 2>/dev/null || true
+if (( IS_LIGHT )); then
+    COLOR_SCHEME="prefer-light"
+    GTK_THEME="Adwaita"
 else
-    gsettings set org.gnome.desktop.interface color-scheme "prefer-dark" 2>/dev/null || true
-    gsettings set org.gnome.desktop.interface gtk-theme "Adwaita-dark" 2>/dev/null || true
+    COLOR_SCHEME="prefer-dark"
+    GTK_THEME="Adwaita-dark"
 fi
 
 # Apply icon theme
-if [[ -f ~/.config/omarchy/current/theme/icons.theme ]]; then
-    gsettings set org.gnome.desktop.interface icon-theme "$(<~/.config/omarchy/current/theme/icons.theme)" 2>/dev/null || true
-else
-    gsettings set org.gnome.desktop.interface icon-theme "Yaru-blue" 2>/dev/null || true
+ICON_THEME="${ICONS_THEME:-Yaru-blue}"
+
+# Write all interface keys in one dconf transaction, falling back to gsettings
+if ! dconf load /org/gnome/desktop/interface/ 2>/dev/null <<EOF
+[/]
+color-scheme='$COLOR_SCHEME'
+gtk-theme='$GTK_THEME'
+icon-theme='$ICON_THEME'
+EOF
+then
+    gsettings set org.gnome.desktop.interface color-scheme "$COLOR_SCHEME" 2>/dev/null
+    gsettings set org.gnome.desktop.interface gtk-theme "$GTK_THEME" 2>/dev/null
+    gsettings set org.gnome.desktop.interface icon-theme "$ICON_THEME" 2>/dev/null
 fi
 
 # Apply Chromium colors
-if command -v chromium &>/dev/null; then
-    if [[ -f ~/.config/omarchy/current/theme/light.mode ]]; then
-        chromium --no-startup-window --set-color-scheme="light" 2>/dev/null || true
+# The two invocations are independent, so run them side by side
+if [[ -n "$CHROMIUM_BIN" ]]; then
+    if (( IS_LIGHT )); then
+        CHROMIUM_SCHEME="light"
     else
-        chromium --no-startup-window --set-color-scheme="dark" 2>/dev/null || true
+        CHROMIUM_SCHEME="dark"
     fi
 
-    if [[ -f ~/.config/omarchy/current/theme/chromium.theme ]]; then
-        chromium --no-startup-window --set-theme-color="$(<~/.config/omarchy/current/theme/chromium.theme)" 2>/dev/null || true
-    else
-        chromium --no-startup-window --set-theme-color="28,32,39" 2>/dev/null || true
-    fi
+    "$CHROMIUM_BIN" --no-startup-window --set-color-scheme="$CHROMIUM_SCHEME" &>/dev/null &
+    CHROMIUM_SCHEME_PID=$!
+    "$CHROMIUM_BIN" --no-startup-window --set-theme-color="${CHROMIUM_THEME:-28,32,39}" &>/dev/null &
+    CHROMIUM_COLOR_PID=$!
+    wait "$CHROMIUM_SCHEME_PID" "$CHROMIUM_COLOR_PID"
 fi
 
-# Trigger alacritty config reload
-touch "$HOME/.config/alacritty/alacritty.toml"
+# Trigger alacritty config reload (its file watcher picks up the mtime bump).
+# Only touch an existing config; alacritty has no reload signal and SIGUSR1
+# would terminate it.
+ALACRITTY_CONFIG="$HOME/.config/alacritty/alacritty.toml"
+[[ -f "$ALACRITTY_CONFIG" ]] && touch -c "$ALACRITTY_CONFIG"
 
 # Apply IDE themes
 echo "🎨 Applying IDE themes..."
 if command -v omarchy-theme-sync &>/dev/null; then
-    omarchy-theme-sync apply "$THEME_NAME" 2>/dev/null || true
+    omarchy-theme-sync apply "$THEME_NAME" 2>/dev/null
 else
     # Look for theme sync script in common locations
     SYNC_LOCATIONS=(
@@ -195,52 +163,451 @@ else
     
     for location in "${SYNC_LOCATIONS[@]}"; do
         if [[ -f "$location" ]]; then
-            python3 "$location" "$THEME_NAME" 2>/dev/null || true
+            python3 "$location" "$THEME_NAME" 2>/dev/null
             break
         fi
     done
 fi
 
-# Restart components (from original omarchy-theme-set)
-pkill -SIGUSR2 btop 2>/dev/null || true
-command -v omarchy-restart-waybar &>/dev/null && omarchy-restart-waybar || true
-command -v omarchy-restart-swayosd &>/dev/null && omarchy-restart-swayosd || true
-command -v makoctl &>/dev/null && makoctl reload || true
-command -v hyprctl &>/dev/null && hyprctl reload || true
+# Restart components (from original omarchy-theme-set).
+# The script doesn't use errexit, so failures here are already non-fatal.
+pkill -SIGUSR2 btop 2>/dev/null
+[[ -n "$WAYBAR_RESTART_BIN" ]] && "$WAYBAR_RESTART_BIN"
+[[ -n "$SWAYOSD_RESTART_BIN" ]] && "$SWAYOSD_RESTART_BIN"
+[[ -n "$MAKOCTL_BIN" ]] && "$MAKOCTL_BIN" reload
+[[ -n "$HYPRCTL_BIN" ]] && "$HYPRCTL_BIN" reload
 
 # Set new background
-command -v omarchy-theme-bg-next &>/dev/null && omarchy-theme-bg-next || true
+[[ -n "$THEME_BG_NEXT_BIN" ]] && "$THEME_BG_NEXT_BIN"
 
 echo "✨ Theme '$THEME_NAME' applied successfully with IDE synchronization!"
-'''
+'''.encode()
+
+# Backward-compatible omarchy-theme-set alias pointing at the enhanced script
+ALIAS_SCRIPT_TEMPLATE = b'#!/bin/bash\nexec "%s" "$@"\n'
+
+
+def _ensure_dir(path) -> None:
+    """Create a directory tree, costing a single stat() when it already exists"""
+    try:
+        if stat.S_ISDIR(os.stat(path).st_mode):
+            return
+    except FileNotFoundError:
+        pass
+    os.makedirs(path, exist_ok=True)
+
+
+def _buffered_output(method):
+    """Emit the messages a public OmarchyIntegration method logged in a single write"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._flush_messages()
+    return wrapper
+
+
+def _render_enhanced_script(search_path: str) -> bytes:
+    """Fill the switcher template with helper paths resolved against search_path"""
+    lines = []
+    for variable, command in RESOLVED_HELPERS:
+        resolved = shutil.which(command, path=search_path) or ''
+        lines.append(f"{variable}={shlex.quote(resolved)}")
+    return ENHANCED_SCRIPT.replace(b'@RESOLVED_HELPERS@', '\n'.join(lines).encode())
+
+
+def _fastcopy(src, dst) -> None:
+    """Copy file contents from src to dst using the cheapest available kernel path"""
+    in_fd = os.open(src, os.O_RDONLY)
+    try:
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Try in-kernel copy first (reflink/server-side copy where supported)
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    offset = 0
+                    while True:
+                        copied = os.copy_file_range(in_fd, out_fd, COPY_BLOCKSIZE)
+                        if copied:
+                            offset += copied
+                            continue
+                        # Some filesystems (procfs, sysfs, FUSE) report 0 straight
+                        # away for a non-empty file; only trust 0 as EOF once data
+                        # has moved, otherwise fall back like shutil does
+                        if offset or not os.fstat(in_fd).st_size:
+                            return
+                        break
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                        raise
+                    os.lseek(in_fd, 0, os.SEEK_SET)
+                    os.ftruncate(out_fd, 0)
+                    os.lseek(out_fd, 0, os.SEEK_SET)
+            
+            # Then sendfile, which still avoids a userspace buffer
+            if hasattr(os, 'sendfile'):
+                try:
+                    offset = 0
+                    while True:
+                        sent = os.sendfile(out_fd, in_fd, offset, COPY_BLOCKSIZE)
+                        if sent:
+                            offset += sent
+                            continue
+                        if offset or not os.fstat(in_fd).st_size:
+                            return
+                        break
+                except OSError as e:
+                    if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK):
+                        raise
+                    os.lseek(in_fd, 0, os.SEEK_SET)
+                    os.ftruncate(out_fd, 0)
+                    os.lseek(out_fd, 0, os.SEEK_SET)
+            
+            # Plain read/write loop with a single reusable buffer
+            buf = bytearray(COPY_BLOCKSIZE)
+            view = memoryview(buf)
+            with open(in_fd, 'rb', buffering=0, closefd=False) as reader:
+                while True:
+                    n = reader.readinto(buf)
+                    if not n:
+                        break
+                    written = 0
+                    while written < n:
+                        written += os.write(out_fd, view[written:n])
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+
+
+def _snapshot_file(src, dst) -> None:
+    """Create dst as a copy of src, preferring a reflink, then a hardlink, then a full copy"""
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        # O_EXCL so an existing dst is never overwritten
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            cloned = True
+        except OSError:
+            cloned = False
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    if cloned:
+        shutil.copystat(src, dst)
+        return
+    
+    os.unlink(dst)
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+    
+    _fastcopy(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _file_sha1(path) -> str:
+    """Return the SHA-1 hex digest of a file's contents"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(COPY_BLOCKSIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_up_to_date(src, dst) -> bool:
+    """Check whether dst already holds the same contents as src"""
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    
+    # Same size but different mtime (e.g. fresh clone) - compare contents
+    return _file_sha1(src) == _file_sha1(dst)
+
+
+def _has_contents(path, expected: bytes) -> bool:
+    """Check whether a file exists and holds exactly the expected bytes"""
+    try:
+        if os.stat(path).st_size != len(expected):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == expected
+    except FileNotFoundError:
+        return False
+
+
+def _write_script(path, content: bytes) -> None:
+    """Write an executable script in a single unbuffered write"""
+    # Write beside the target and rename over it, so a hardlinked backup of
+    # the previous file keeps its contents instead of being truncated
+    # (os.open fds are already close-on-exec per PEP 446)
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        try:
+            view = memoryview(content)
+            written = 0
+            while written < len(content):
+                written += os.write(fd, view[written:])
+            # O_CREAT's mode only applies to new files, so fix up existing ones
+            os.fchmod(fd, 0o755)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Never leave a half-written temp file behind
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class OmarchyIntegration:
+    """Handles integration with the Omarchy theming system"""
+    
+    def __init__(self):
+        self.omarchy_bin_dir = OMARCHY_BIN_DIR
+        self.themes_dir = THEMES_DIR
+        self.project_dir = PROJECT_DIR
+        self.theme_generator_source = self.project_dir / 'src' / 'theme_generator.py'
+        self.theme_generator_dest = self.themes_dir / 'theme_generator.py'
+        self.fingerprint_file = self.themes_dir / FINGERPRINT_FILENAME
+        self._messages: list[str] = []
+        self._step_output = threading.local()
+    
+    def _log(self, message: str) -> None:
+        """Queue a line of output for the next flush"""
+        # Setup steps running on pool threads log into their own buffer
+        buffer = getattr(self._step_output, 'messages', None)
+        (self._messages if buffer is None else buffer).append(message)
+    
+    def _run_step(self, step) -> tuple[bool, list[str]]:
+        """Run a setup step on the current thread, returning its result and logged lines"""
+        lines = self._step_output.messages = []
+        try:
+            return step(), lines
+        finally:
+            del self._step_output.messages
+    
+    def _flush_messages(self) -> None:
+        """Write all queued output at once"""
+        if self._messages:
+            sys.stdout.write('\n'.join(self._messages) + '\n')
+            sys.stdout.flush()
+            self._messages.clear()
+    
+    @functools.cached_property
+    def switcher_script(self) -> bytes:
+        """Rendered contents of the enhanced theme switcher"""
+        # Omarchy's own bin dir may not be on the installer's PATH yet
+        search_path = os.pathsep.join(filter(None, (os.environ.get('PATH'), str(self.omarchy_bin_dir))))
+        return _render_enhanced_script(search_path)
+    
+    def _setup_fingerprint(self) -> Optional[str]:
+        """Hash the inputs of setup, or None if the generator source is missing"""
+        digest = hashlib.sha256()
+        try:
+            with open(self.theme_generator_source, 'rb') as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            return None
+        digest.update(self.switcher_script)
+        return digest.hexdigest()
+    
+    def _is_setup_current(self, fingerprint: Optional[str]) -> bool:
+        """Check whether the last successful setup used the same inputs"""
+        if fingerprint is None:
+            return False
+        try:
+            if self.fingerprint_file.read_text().strip() != fingerprint:
+                return False
+        except FileNotFoundError:
+            return False
+        
+        # Guard against installed files having been removed or replaced, e.g. by an Omarchy update
+        if not self.theme_generator_dest.exists():
+            return False
+        enhanced_path = self.omarchy_bin_dir / 'omarchy-theme-set-enhanced'
+        installed = (
+            (enhanced_path, self.switcher_script),
+            (self.omarchy_bin_dir / 'omarchy-theme-set', ALIAS_SCRIPT_TEMPLATE % os.fsencode(enhanced_path)),
+        )
+        return all(_has_contents(path, expected) for path, expected in installed)
+    
+    def _write_fingerprint(self, fingerprint: str) -> None:
+        """Atomically record the fingerprint of a successful setup"""
+        tmp_file = self.fingerprint_file.with_name(FINGERPRINT_FILENAME + '.tmp')
+        tmp_file.write_text(fingerprint + '\n')
+        os.replace(tmp_file, self.fingerprint_file)
+    
+    def _ensure_directories(self) -> None:
+        """Create the directories setup writes into"""
+        _ensure_dir(self.omarchy_bin_dir)
+        _ensure_dir(self.themes_dir)
+    
+    @_buffered_output
+    def setup_integration(self) -> bool:
+        """Set up integration with Omarchy system"""
+        self._log("🔧 Setting up Omarchy IDE Theme Sync integration...")
+        
+        fingerprint = self._setup_fingerprint()
+        if self._is_setup_current(fingerprint):
+            self._log("✅ Integration already current, nothing to do")
+            return True
+        
+        # Ensure directories exist (only setup writes, so remove skips this)
+        self._ensure_directories()
+        
+        # The steps touch disjoint files, so overlap their I/O
+        steps = (
+            self._install_theme_generator,
+            self._setup_theme_switching_hooks,
+            self._setup_theme_installation_hooks,
+        )
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            futures = [pool.submit(self._run_step, step) for step in steps]
+            # Merge each step's output in step order, however the threads finished
+            success = True
+            for future in futures:
+                step_success, lines = future.result()
+                self._messages.extend(lines)
+                success = success and step_success
+        
+        if success:
+            if fingerprint is not None:
+                self._write_fingerprint(fingerprint)
+            self._log("✅ Integration setup complete!")
+            self._log("\n🎉 Your VS Code and Cursor will now automatically sync with Omarchy themes!")
+            self._log("\nUsage:")
+            self._log("  omarchy-theme-set <theme-name>  # Themes will auto-sync")
+            self._log("  omarchy-theme-install <url>     # New themes will auto-generate editor themes")
+        else:
+            self._log("❌ Integration setup failed. Check errors above.")
+        
+        return success
+    
+    def _install_theme_generator(self) -> bool:
+        """Install the theme generator to the themes directory"""
+        try:
+            # Install the theme generator (main one)
+            comprehensive_source = self.theme_generator_source
+            comprehensive_dest = self.theme_generator_dest
+            
+            try:
+                if _is_up_to_date(comprehensive_source, comprehensive_dest):
+                    self._log(f"✓ Theme generator already up-to-date: {comprehensive_dest}")
+                    return True
+                
+                _fastcopy(comprehensive_source, comprehensive_dest)
+            except FileNotFoundError:
+                self._log(f"❌ Theme generator not found: {comprehensive_source}")
+                return False
+            
+            shutil.copystat(comprehensive_source, comprehensive_dest)
+            comprehensive_dest.chmod(0o755)
+            self._log(f"✓ Installed theme generator: {comprehensive_dest}")
+            return True
+            
+        except Exception as e:
+            self._log(f"❌ Failed to install theme generators: {e}")
+            return False
+    
+    def _setup_theme_switching_hooks(self) -> bool:
+        """Setup hooks for theme switching"""
+        try:
+            self._backup_original_switcher()
+            
+            # Create enhanced theme switcher
+            enhanced_script = self._create_enhanced_theme_switcher()
+            if enhanced_script:
+                self._log(f"✓ Created enhanced theme switcher: {enhanced_script}")
+                return True
+            else:
+                return False
+                
+        except Exception as e:
+            self._log(f"❌ Failed to setup theme switching hooks: {e}")
+            return False
+    
+    def _backup_original_switcher(self) -> None:
+        """Snapshot the upstream omarchy-theme-set once, before the alias replaces it"""
+        original_script = self.omarchy_bin_dir / 'omarchy-theme-set'
+        backup_script = self.omarchy_bin_dir / 'omarchy-theme-set.backup'
+        enhanced_path = self.omarchy_bin_dir / 'omarchy-theme-set-enhanced'
+        
+        # Never back up our own alias; restoring it would exec a removed script
+        if _has_contents(original_script, ALIAS_SCRIPT_TEMPLATE % os.fsencode(enhanced_path)):
+            return
+        
+        try:
+            _snapshot_file(original_script, backup_script)
+            self._log(f"✓ Backed up original theme script: {backup_script}")
+        except (FileExistsError, FileNotFoundError):
+            pass
+    
+    def _create_enhanced_theme_switcher(self) -> Optional[Path]:
+        """Create the enhanced omarchy-theme-set script"""
+        script_path = self.omarchy_bin_dir / 'omarchy-theme-set-enhanced'
         
         try:
-            with open(script_path, 'w') as f:
-                f.write(script_content)
-            script_path.chmod(0o755)
+            _write_script(script_path, self.switcher_script)
             
             # Create alias script for backward compatibility
             alias_script = self.omarchy_bin_dir / 'omarchy-theme-set'
-            with open(alias_script, 'w') as f:
-                f.write('#!/bin/bash\n')
-                f.write(f'exec "{script_path}" "$@"\n')
-            alias_script.chmod(0o755)
+            _write_script(alias_script, ALIAS_SCRIPT_TEMPLATE % os.fsencode(script_path))
             
             return script_path
         except Exception as e:
-            print(f"❌ Failed to create enhanced theme switcher: {e}")
+            self._log(f"❌ Failed to create enhanced theme switcher: {e}")
             return None
     
     def _setup_theme_installation_hooks(self) -> bool:
         """Setup hooks for when new themes are installed"""
         # For now, this would require modifications to the omarchy-theme-install command
         # We'll document this as a future enhancement
-        print("✓ Theme installation hooks ready (requires omarchy-theme-install integration)")
+        self._log("✓ Theme installation hooks ready (requires omarchy-theme-install integration)")
         return True
     
+    @_buffered_output
+    def refresh_theme_switcher(self) -> bool:
+        """Regenerate the enhanced theme switcher, re-resolving helper paths"""
+        self._log("🔄 Refreshing enhanced theme switcher...")
+        
+        self._ensure_directories()
+        
+        # The alias overwrites omarchy-theme-set, so keep the upstream script first
+        try:
+            self._backup_original_switcher()
+        except Exception as e:
+            self._log(f"❌ Failed to back up original theme script: {e}")
+            return False
+        
+        enhanced_script = self._create_enhanced_theme_switcher()
+        if enhanced_script:
+            self._log(f"✓ Refreshed enhanced theme switcher: {enhanced_script}")
+            return True
+        return False
+    
+    @_buffered_output
     def remove_integration(self) -> bool:
         """Remove the integration (for uninstall)"""
-        print("🗑️ Removing Omarchy IDE Theme Sync integration...")
+        self._log("🗑️ Removing Omarchy IDE Theme Sync integration...")
         
         try:
             # Restore original theme script if backup exists
@@ -248,38 +615,42 @@ echo "✨ Theme '$THEME_NAME' applied successfully with IDE synchronization!"
             backup_script = self.omarchy_bin_dir / 'omarchy-theme-set.backup'
             enhanced_script = self.omarchy_bin_dir / 'omarchy-theme-set-enhanced'
             
-            if backup_script.exists():
-                import shutil
-                shutil.copy2(backup_script, original_script)
-                backup_script.unlink()
-                print("✓ Restored original omarchy-theme-set script")
+            try:
+                os.replace(backup_script, original_script)
+                self._log("✓ Restored original omarchy-theme-set script")
+            except FileNotFoundError:
+                pass
             
-            if enhanced_script.exists():
+            try:
                 enhanced_script.unlink()
-                print("✓ Removed enhanced theme script")
+                self._log("✓ Removed enhanced theme script")
+            except FileNotFoundError:
+                pass
             
             # Remove theme generator
-            generator_path = self.themes_dir / 'theme_generator.py'
-            if generator_path.exists():
-                generator_path.unlink()
-                print("✓ Removed theme generator")
+            try:
+                self.theme_generator_dest.unlink()
+                self._log("✓ Removed theme generator")
+            except FileNotFoundError:
+                pass
             
-
+            self.fingerprint_file.unlink(missing_ok=True)
             
-            print("✅ Integration removed successfully")
+            self._log("✅ Integration removed successfully")
             return True
             
         except Exception as e:
-            print(f"❌ Failed to remove integration: {e}")
+            self._log(f"❌ Failed to remove integration: {e}")
             return False
 
 
 def main():
     """Main function for standalone usage"""
+    # Deferred so importing OmarchyIntegration as a library doesn't pay for argparse
     import argparse
     
     parser = argparse.ArgumentParser(description='Omarchy Integration Setup')
-    parser.add_argument('action', choices=['setup', 'remove'], 
+    parser.add_argument('action', choices=['setup', 'remove', 'refresh-script'], 
                        help='Action to perform')
     
     args = parser.parse_args()
@@ -290,6 +661,8 @@ def main():
         success = integration.setup_integration()
     elif args.action == 'remove':
         success = integration.remove_integration()
+    elif args.action == 'refresh-script':
+        success = integration.refresh_theme_switcher()
     else:
         success = False
     
@@ -5,12 +5,19 @@ Generates VS Code and Cursor themes from Omarchy color schemes
 """
 
 import json
+import hashlib
 import os
+import io
 import sys
 import argparse
+import contextlib
+import operator
 from pathlib import Path
 import re
-import colorsys
+from functools import lru_cache
+
+# Default location of Omarchy themes, resolved once per process
+THEMES_DIR = Path.home() / '.config' / 'omarchy' / 'themes'
 
 # Constants for color calculations
 GAMMA_THRESHOLD = 0.03928
@@ -24,18 +31,112 @@ LUMINANCE_R = 0.2126
 LUMINANCE_G = 0.7152
 LUMINANCE_B = 0.0722
 
+def _gamma_correct(c):
+    """Convert a gamma-encoded sRGB channel in [0, 1] to linear light"""
+    return c / GAMMA_DIVISOR if c <= GAMMA_THRESHOLD else pow((c + GAMMA_OFFSET) / GAMMA_DENOMINATOR, GAMMA_POWER)
+
+# Channels are 8-bit, so precompute the linearized value of every possible one
+SRGB_TO_LINEAR = tuple(_gamma_correct(i / 255.0) for i in range(256))
+
+# Background assumed when a palette lacks one
+DEFAULT_BACKGROUND = '#1e1e2e'
+
+# Terminal color slots, in alacritty order
+TERMINAL_COLOR_NAMES = ('black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white')
+
+# Fallback palette (Dracula) for missing or invalid colors
+FALLBACK_COLORS = {
+    'background': '#282a36',
+    'foreground': '#f8f8f2',
+    'normal': {
+        'black': '#21222c',
+        'red': '#ff5555',
+        'green': '#50fa7b',
+        'yellow': '#f1fa8c',
+        'blue': '#bd93f9',
+        'magenta': '#ff79c6',
+        'cyan': '#8be9fd',
+        'white': '#f8f8f2'
+    },
+    'bright': {
+        'black': '#6272a4',
+        'red': '#ff6e6e',
+        'green': '#69ff94',
+        'yellow': '#ffffa5',
+        'blue': '#d6acff',
+        'magenta': '#ff92df',
+        'cyan': '#a4ffff',
+        'white': '#ffffff'
+    }
+}
+
 # Contrast ratio thresholds
 MIN_READABLE_CONTRAST = 3.0
 MIN_ACCEPTABLE_CONTRAST = 2.0
 
+# Background adjustment factors for derived UI colors
+# Light theme: darker backgrounds for contrast
+UI_COLOR_FACTORS_LIGHT = (
+    ('side_bg', 0.15),
+    ('panel_bg', 0.2),
+    ('tab_bg', 0.1),
+    ('input_bg', 0.05),
+    ('list_bg', 0.1),
+    ('hover_bg', 0.2),
+    ('border_color', 0.3),
+)
+# Dark theme: lighter backgrounds for contrast
+UI_COLOR_FACTORS_DARK = (
+    ('side_bg', 0.1),
+    ('panel_bg', 0.15),
+    ('tab_bg', 0.05),
+    ('input_bg', 0.05),
+    ('list_bg', 0.1),
+    ('hover_bg', 0.15),
+    ('border_color', 0.2),
+)
+
+# A theme generates in well under a millisecond, so a process pool only pays
+# for its startup cost on large theme libraries
+PARALLEL_MIN_THEMES = 64
+
+# orjson saves ~0.2 ms per dump but costs ~13 ms to import, so it is only
+# loaded for batches at least this large
+ORJSON_MIN_THEMES = 100
+_orjson = None
+
+# Sidecar next to each generated theme holding the hash of its inputs
+SYNC_HASH_SUFFIX = '.sync-hash'
+
+# Precompiled alacritty.toml patterns
+_RE_BACKGROUND = re.compile(r'background\s*=\s*[\'"]([^\'"]+)[\'"]')
+_RE_FOREGROUND = re.compile(r'foreground\s*=\s*[\'"]([^\'"]+)[\'"]')
+_RE_CURSOR = re.compile(r'cursor\s*=\s*[\'"]([^\'"]+)[\'"]')
+# A `[table]` or `[[array]]` header line; re.split yields (name, body) pairs
+_RE_SECTION_HEADER = re.compile(r'^[ \t]*\[\[?([^\[\]\n]+)\]\]?[ \t]*(?:#.*)?$', re.MULTILINE)
+# One `key = value` line, split on the first '='
+_RE_KEY_VALUE = re.compile(r'^([^=\n]*)=(.*)$', re.MULTILINE)
+# A hex color already in the canonical #rrggbb form
+_match_canonical_hex = re.compile(r'#[0-9a-fA-F]{6}').fullmatch
+# Hex colors normalize_hex_color accepts: #RGB, #RRGGBB, 0xRRGGBB, with or without prefix
+_match_hex_color = re.compile(r'(?:#|0x)?(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})').fullmatch
+
 
 def normalize_hex_color(color_value):
     """Normalize hex color value to proper format for VSCode"""
     if not color_value:
         return None
+    return _normalize_hex_color_cached(str(color_value))
+
+@lru_cache(maxsize=512)
+def _normalize_hex_color_cached(color_value):
+    """Normalize a string color value; palettes repeat, so results are memoized"""
+    # Already canonical #rrggbb, e.g. rgb_to_hex output
+    if _match_canonical_hex(color_value):
+        return color_value
     
     # Remove quotes and whitespace
-    color_value = str(color_value).strip().strip('"\'')
+    color_value = color_value.strip().strip('"\'')
     
     # Handle 0x prefix (from alacritty)
     if color_value.startswith('0x'):
@@ -61,34 +162,29 @@ def normalize_hex_color(color_value):
 
 def is_valid_hex_color(hex_color):
     """Check if a color is a valid hex color"""
+    if not hex_color:
+        return False
+    return _match_hex_color(str(hex_color).strip().strip('"\'')) is not None
+
+@lru_cache(maxsize=256)
+def get_luminance(hex_color):
+    """Calculate relative luminance of a color"""
     normalized = normalize_hex_color(hex_color)
-    return normalized is not None
+    if not normalized:
+        return 0
+    
+    try:
+        value = int(normalized[1:], 16)
+    except (ValueError, TypeError):
+        return 0
+    
+    # Gamma correction via lookup table
+    return (LUMINANCE_R * SRGB_TO_LINEAR[(value >> 16) & 0xff]
+            + LUMINANCE_G * SRGB_TO_LINEAR[(value >> 8) & 0xff]
+            + LUMINANCE_B * SRGB_TO_LINEAR[value & 0xff])
 
 def calculate_contrast_ratio(color1, color2):
     """Calculate contrast ratio between two colors for accessibility"""
-    def get_luminance(hex_color):
-        """Calculate relative luminance of a color"""
-        normalized = normalize_hex_color(hex_color)
-        if not normalized:
-            return 0
-        
-        try:
-            r = int(normalized[1:3], 16) / 255.0
-            g = int(normalized[3:5], 16) / 255.0
-            b = int(normalized[5:7], 16) / 255.0
-            
-            # Apply gamma correction
-            def gamma_correct(c):
-                return c / GAMMA_DIVISOR if c <= GAMMA_THRESHOLD else pow((c + GAMMA_OFFSET) / GAMMA_DENOMINATOR, GAMMA_POWER)
-            
-            r = gamma_correct(r)
-            g = gamma_correct(g)
-            b = gamma_correct(b)
-            
-            return LUMINANCE_R * r + LUMINANCE_G * g + LUMINANCE_B * b
-        except (ValueError, TypeError):
-            return 0
-    
     lum1 = get_luminance(color1)
     lum2 = get_luminance(color2)
     
@@ -98,54 +194,77 @@ def calculate_contrast_ratio(color1, color2):
     else:
         return (lum2 + 0.05) / (lum1 + 0.05)
 
+@lru_cache(maxsize=256)
 def hex_to_hsv(hex_color):
     """Convert hex color to HSV for better color manipulation"""
     normalized = normalize_hex_color(hex_color)
     if not normalized:
         return (0, 0, 0)
     try:
-        r = int(normalized[1:3], 16) / 255.0
-        g = int(normalized[3:5], 16) / 255.0
-        b = int(normalized[5:7], 16) / 255.0
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
-        return (h, s, v)
+        value = int(normalized[1:], 16)
+        r = ((value >> 16) & 0xff) / 255.0
+        g = ((value >> 8) & 0xff) / 255.0
+        b = (value & 0xff) / 255.0
     except (ValueError, TypeError):
         return (0, 0, 0)
+    # Inlined colorsys.rgb_to_hsv
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    if minc == maxc:
+        return (0.0, 0.0, maxc)
+    rangec = maxc - minc
+    s = rangec / maxc
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    if r == maxc:
+        h = bc - gc
+    elif g == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    return ((h / 6.0) % 1.0, s, maxc)
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB tuple"""
     normalized = normalize_hex_color(hex_color)
     if not normalized:
         return (0, 0, 0)
     try:
-        r = int(normalized[1:3], 16)
-        g = int(normalized[3:5], 16)
-        b = int(normalized[5:7], 16)
-        return (r, g, b)
+        value = int(normalized[1:], 16)
+        return ((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff)
     except (ValueError, TypeError):
         return (0, 0, 0)
 
+def _hex_to_rgb_fast(normalized_hex):
+    """Convert an already-normalized #rrggbb color to an RGB tuple, without validation"""
+    value = int(normalized_hex[1:], 16)
+    return ((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff)
+
 def rgb_to_hex(r, g, b):
     """Convert RGB tuple to hex color"""
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return "#%06x" % ((r << 16) | (g << 8) | b)
 
+@lru_cache(maxsize=256)
 def is_light_theme(background_color):
     """Determine if a theme is light or dark based on background color"""
     normalized = normalize_hex_color(background_color)
     if not normalized:
         return False  # Default to dark theme if color is invalid
-    r, g, b = hex_to_rgb(normalized)
+    r, g, b = _hex_to_rgb_fast(normalized)
     # Calculate perceived brightness
     brightness = (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
     return brightness > 0.5
 
+@lru_cache(maxsize=256)
 def adjust_color_for_theme(hex_color, is_light, factor=0.1):
     """Adjust color based on whether it's a light or dark theme"""
     normalized = normalize_hex_color(hex_color)
     if not normalized:
         return hex_color  # Return original if can't normalize
     
-    r, g, b = hex_to_rgb(normalized)
+    r, g, b = _hex_to_rgb_fast(normalized)
     
     if is_light:
         # For light themes, darken colors slightly
@@ -162,79 +281,27 @@ def adjust_color_for_theme(hex_color, is_light, factor=0.1):
 
 def generate_ui_colors(colors, is_light):
     """Generate UI colors based on theme type"""
-    bg = colors.get('background', '#1e1e2e')
-    fg = colors.get('foreground', '#cdd6f4')
-    normal = colors.get('normal', {})
-    bright = colors.get('bright', {})
-    
-    if is_light:
-        # Light theme: darker backgrounds for contrast
-        side_bg = adjust_color_for_theme(bg, is_light, 0.15)
-        panel_bg = adjust_color_for_theme(bg, is_light, 0.2)
-        tab_bg = adjust_color_for_theme(bg, is_light, 0.1)
-        input_bg = adjust_color_for_theme(bg, is_light, 0.05)
-        list_bg = adjust_color_for_theme(bg, is_light, 0.1)
-        hover_bg = adjust_color_for_theme(bg, is_light, 0.2)
-        border_color = adjust_color_for_theme(bg, is_light, 0.3)
-    else:
-        # Dark theme: lighter backgrounds for contrast
-        side_bg = adjust_color_for_theme(bg, is_light, 0.1)
-        panel_bg = adjust_color_for_theme(bg, is_light, 0.15)
-        tab_bg = adjust_color_for_theme(bg, is_light, 0.05)
-        input_bg = adjust_color_for_theme(bg, is_light, 0.05)
-        list_bg = adjust_color_for_theme(bg, is_light, 0.1)
-        hover_bg = adjust_color_for_theme(bg, is_light, 0.15)
-        border_color = adjust_color_for_theme(bg, is_light, 0.2)
-    
-    return {
-        'side_bg': side_bg,
-        'panel_bg': panel_bg,
-        'tab_bg': tab_bg,
-        'input_bg': input_bg,
-        'list_bg': list_bg,
-        'hover_bg': hover_bg,
-        'border_color': border_color
-    }
+    return dict(_ui_colors_for(colors.get('background', DEFAULT_BACKGROUND), is_light))
+
+@lru_cache(maxsize=128)
+def _ui_colors_for(bg, is_light):
+    """Derive the (name, color) UI pairs for a background; only bg and theme type matter"""
+    factors = UI_COLOR_FACTORS_LIGHT if is_light else UI_COLOR_FACTORS_DARK
+    return tuple((name, adjust_color_for_theme(bg, is_light, factor)) for name, factor in factors)
 
 def validate_and_fix_colors(colors):
     """Validate and fix color values, providing fallbacks for invalid colors"""
-    # Default fallback colors
-    fallback_colors = {
-        'background': '#282a36',
-        'foreground': '#f8f8f2',
-        'normal': {
-            'black': '#21222c',
-            'red': '#ff5555',
-            'green': '#50fa7b',
-            'yellow': '#f1fa8c',
-            'blue': '#bd93f9',
-            'magenta': '#ff79c6',
-            'cyan': '#8be9fd',
-            'white': '#f8f8f2'
-        },
-        'bright': {
-            'black': '#6272a4',
-            'red': '#ff6e6e',
-            'green': '#69ff94',
-            'yellow': '#ffffa5',
-            'blue': '#d6acff',
-            'magenta': '#ff92df',
-            'cyan': '#a4ffff',
-            'white': '#ffffff'
-        }
-    }
-    
     fixed_colors = {}
     issues_found = []
     
     # Validate and fix primary colors
-    for key in ['background', 'foreground', 'cursor']:
+    for key in ('background', 'foreground', 'cursor'):
         if key in colors:
             normalized = normalize_hex_color(colors[key])
             if normalized:
                 fixed_colors[key] = normalized
             else:
-                fixed_colors[key] = fallback_colors.get(key, fallback_colors['background'])
+                fixed_colors[key] = FALLBACK_COLORS.get(key, FALLBACK_COLORS['background'])
                 issues_found.append(f"Invalid {key} color '{colors[key]}' - using fallback")
         else:
             # Special handling for cursor color - derive from foreground if available
@@ -242,38 +309,25 @@ def validate_and_fix_colors(colors):
                 fixed_colors[key] = fixed_colors['foreground']
                 issues_found.append(f"Missing {key} color - derived from foreground")
             else:
-                fixed_colors[key] = fallback_colors.get(key, fallback_colors['background'])
+                fixed_colors[key] = FALLBACK_COLORS.get(key, FALLBACK_COLORS['background'])
                 issues_found.append(f"Missing {key} color - using fallback")
     
-    # Validate and fix normal colors
-    fixed_colors['normal'] = {}
-    normal_colors = colors.get('normal', {})
-    for color_name in ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']:
-        if color_name in normal_colors:
-            normalized = normalize_hex_color(normal_colors[color_name])
-            if normalized:
-                fixed_colors['normal'][color_name] = normalized
-            else:
-                fixed_colors['normal'][color_name] = fallback_colors['normal'][color_name]
-                issues_found.append(f"Invalid normal.{color_name} color '{normal_colors[color_name]}' - using fallback")
-        else:
-            fixed_colors['normal'][color_name] = fallback_colors['normal'][color_name]
-            issues_found.append(f"Missing normal.{color_name} color - using fallback")
-    
-    # Validate and fix bright colors
-    fixed_colors['bright'] = {}
-    bright_colors = colors.get('bright', {})
-    for color_name in ['black', 'red', 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white']:
-        if color_name in bright_colors:
-            normalized = normalize_hex_color(bright_colors[color_name])
-            if normalized:
-                fixed_colors['bright'][color_name] = normalized
+    # Validate and fix normal and bright colors in one pass
+    for section in ('normal', 'bright'):
+        fixed_section = fixed_colors[section] = {}
+        section_colors = colors.get(section, {})
+        section_fallbacks = FALLBACK_COLORS[section]
+        for color_name in TERMINAL_COLOR_NAMES:
+            if color_name in section_colors:
+                normalized = normalize_hex_color(section_colors[color_name])
+                if normalized:
+                    fixed_section[color_name] = normalized
+                else:
+                    fixed_section[color_name] = section_fallbacks[color_name]
+                    issues_found.append(f"Invalid {section}.{color_name} color '{section_colors[color_name]}' - using fallback")
             else:
-                fixed_colors['bright'][color_name] = fallback_colors['bright'][color_name]
-                issues_found.append(f"Invalid bright.{color_name} color '{bright_colors[color_name]}' - using fallback")
-        else:
-            fixed_colors['bright'][color_name] = fallback_colors['bright'][color_name]
-            issues_found.append(f"Missing bright.{color_name} color - using fallback")
+                fixed_section[color_name] = section_fallbacks[color_name]
+                issues_found.append(f"Missing {section}.{color_name} color - using fallback")
     
     # Check contrast ratios for readability
     bg_color = fixed_colors['background']
@@ -284,12 +338,30 @@ def validate_and_fix_colors(colors):
         issues_found.append(f"Low contrast ratio ({contrast:.2f}) between background and foreground")
         # If contrast is too low, use fallback colors
         if contrast < MIN_ACCEPTABLE_CONTRAST:
-            fixed_colors['background'] = fallback_colors['background']
-            fixed_colors['foreground'] = fallback_colors['foreground']
+            fixed_colors['background'] = FALLBACK_COLORS['background']
+            fixed_colors['foreground'] = FALLBACK_COLORS['foreground']
             issues_found.append("Applied fallback colors due to extremely low contrast")
     
     return fixed_colors, issues_found
 
+def _parse_color_section(section_body):
+    """Parse `name = value` lines from a color section into a dict"""
+    section_colors = {}
+    for match in _RE_KEY_VALUE.finditer(section_body):
+        key = match.group(1).strip()
+        value = match.group(2).strip().strip('"\'')
+        if key and value and not key.startswith('#'):
+            section_colors[key] = value
+    return section_colors
+
+def _split_sections(content):
+    """Map each TOML table name to its body text, keeping the first occurrence"""
+    parts = _RE_SECTION_HEADER.split(content)
+    sections = {}
+    for i in range(1, len(parts), 2):
+        sections.setdefault(parts[i].strip(), parts[i + 1])
+    return sections
+
 def parse_alacritty_colors(alacritty_file):
     """Parse alacritty.toml and extract color information"""
     colors = {}
@@ -299,42 +371,24 @@ def parse_alacritty_colors(alacritty_file):
             content = f.read()
             
         # Extract primary colors
-        primary_match = re.search(r'background\s*=\s*[\'"]([^\'"]+)[\'"]', content)
+        primary_match = _RE_BACKGROUND.search(content)
         if primary_match:
             colors['background'] = primary_match.group(1)
             
-        primary_match = re.search(r'foreground\s*=\s*[\'"]([^\'"]+)[\'"]', content)
+        primary_match = _RE_FOREGROUND.search(content)
         if primary_match:
             colors['foreground'] = primary_match.group(1)
             
+        sections = _split_sections(content)
+        
         # Extract normal colors
-        normal_colors = {}
-        normal_section = re.search(r'\[colors\.normal\](.*?)(?=\[|$)', content, re.DOTALL)
-        if normal_section:
-            for line in normal_section.group(1).split('\n'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"\'')
-                    if key and value and not key.startswith('#'):
-                        normal_colors[key] = value
-        colors['normal'] = normal_colors
+        colors['normal'] = _parse_color_section(sections.get('colors.normal', ''))
         
         # Extract bright colors
-        bright_colors = {}
-        bright_section = re.search(r'\[colors\.bright\](.*?)(?=\[|$)', content, re.DOTALL)
-        if bright_section:
-            for line in bright_section.group(1).split('\n'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"\'')
-                    if key and value and not key.startswith('#'):
-                        bright_colors[key] = value
-        colors['bright'] = bright_colors
+        colors['bright'] = _parse_color_section(sections.get('colors.bright', ''))
         
         # Extract cursor colors
-        cursor_match = re.search(r'cursor\s*=\s*[\'"]([^\'"]+)[\'"]', content)
+        cursor_match = _RE_CURSOR.search(content)
         if cursor_match:
             colors['cursor'] = cursor_match.group(1)
             
@@ -343,488 +397,488 @@ def parse_alacritty_colors(alacritty_file):
         
     return colors
 
+# VS Code color customizations as (setting key, palette token) pairs. Tokens name
+# a base color ('bg', 'fg', 'cursor'), a terminal color ('normal.blue',
+# 'bright.white'), a derived UI color from generate_ui_colors, or a constant.
+VSCODE_COLOR_TEMPLATE = (
+    # ===== EDITOR =====
+    ("editor.background", "bg"),
+    ("editor.foreground", "fg"),
+    ("editor.emptyBackground", "bg"),
+    ("editor.lineHighlightBackground", "list_bg"),
+    ("editor.selectionBackground", "tab_bg"),
+    ("editor.findMatchBackground", "normal.green"),
+    ("editor.findMatchHighlightBackground", "hover_bg"),
+    ("editorCursor.foreground", "cursor"),
+    ("editorWhitespace.foreground", "normal.black"),
+    ("editorIndentGuide.background", "border_color"),
+    ("editorIndentGuide.activeBackground", "normal.green"),
+    ("editor.lineHighlightBorder", "border_color"),
+    ("editor.rangeHighlightBackground", "hover_bg"),
+    ("editor.symbolHighlightBackground", "hover_bg"),
+    ("editor.wordHighlightBackground", "hover_bg"),
+    ("editor.wordHighlightStrongBackground", "tab_bg"),
+    ("editorBracketMatch.background", "border_color"),
+    ("editorBracketMatch.border", "normal.blue"),
+    ("editorCodeLens.foreground", "normal.black"),
+    ("editorError.foreground", "normal.red"),
+    ("editorWarning.foreground", "normal.yellow"),
+    ("editorInfo.foreground", "normal.blue"),
+    ("editorHint.foreground", "normal.green"),
+    ("editorGutter.background", "bg"),
+    ("editorGutter.modifiedBackground", "normal.yellow"),
+    ("editorGutter.addedBackground", "normal.green"),
+    ("editorGutter.deletedBackground", "normal.red"),
+    ("editorUnnecessaryCode.opacity", "unnecessary_code_opacity"),
+    ("editorSuggestWidget.background", "input_bg"),
+    ("editorSuggestWidget.border", "border_color"),
+    ("editorSuggestWidget.selectedBackground", "list_bg"),
+    ("editorSuggestWidget.highlightForeground", "normal.blue"),
+    ("editorHoverWidget.background", "input_bg"),
+    ("editorHoverWidget.border", "border_color"),
+
+    # ===== EDITOR GROUP =====
+    ("editorGroup.background", "bg"),
+    ("editorGroup.border", "border_color"),
+    ("editorGroupHeader.background", "side_bg"),
+    ("editorGroupHeader.tabsBackground", "side_bg"),
+    ("editorGroupHeader.tabsBorder", "border_color"),
+    ("editorGroupHeader.noTabsBackground", "side_bg"),
+
+    # ===== BREADCRUMBS =====
+    ("breadcrumb.background", "bg"),
+    ("breadcrumb.foreground", "fg"),
+    ("breadcrumb.focusForeground", "normal.blue"),
+    ("breadcrumb.activeSelectionForeground", "fg"),
+    ("breadcrumbPicker.background", "input_bg"),
+    ("breadcrumbPicker.foreground", "fg"),
+
+    # ===== SIDEBAR =====
+    ("sideBar.background", "side_bg"),
+    ("sideBar.foreground", "fg"),
+    ("sideBarTitle.foreground", "fg"),
+    ("sideBarSectionHeader.background", "border_color"),
+    ("sideBarSectionHeader.foreground", "fg"),
+
+    # ===== ACTIVITY BAR =====
+    ("activityBar.background", "side_bg"),
+    ("activityBar.foreground", "fg"),
+    ("activityBar.activeBorder", "normal.blue"),
+    ("activityBar.activeBackground", "hover_bg"),
+    ("activityBar.inactiveForeground", "normal.black"),
+    ("activityBarBadge.background", "normal.red"),
+    ("activityBarBadge.foreground", "bg"),
+
+    # ===== STATUS BAR =====
+    ("statusBar.background", "side_bg"),
+    ("statusBar.foreground", "fg"),
+    ("statusBar.debuggingBackground", "normal.red"),
+    ("statusBar.debuggingForeground", "fg"),
+    ("statusBar.noFolderBackground", "side_bg"),
+    ("statusBar.noFolderForeground", "fg"),
+    ("statusBarItem.prominentBackground", "tab_bg"),
+    ("statusBarItem.prominentForeground", "fg"),
+    ("statusBarItem.hoverBackground", "hover_bg"),
+    ("statusBarItem.errorBackground", "normal.red"),
+    ("statusBarItem.errorForeground", "fg"),
+    ("statusBarItem.warningBackground", "normal.yellow"),
+    ("statusBarItem.warningForeground", "bg"),
+
+    # ===== TITLE BAR =====
+    ("titleBar.activeBackground", "side_bg"),
+    ("titleBar.activeForeground", "fg"),
+    ("titleBar.inactiveBackground", "panel_bg"),
+    ("titleBar.inactiveForeground", "normal.black"),
+
+    # ===== TABS =====
+    ("tab.activeBackground", "tab_bg"),
+    ("tab.activeForeground", "fg"),
+    ("tab.inactiveBackground", "side_bg"),
+    ("tab.inactiveForeground", "normal.black"),
+    ("tab.border", "border_color"),
+    ("tab.activeBorder", "normal.blue"),
+    ("tab.hoverBackground", "hover_bg"),
+    ("tab.hoverForeground", "fg"),
+    ("tab.unfocusedActiveBackground", "tab_bg"),
+    ("tab.unfocusedActiveForeground", "normal.black"),
+    ("tab.unfocusedInactiveBackground", "side_bg"),
+    ("tab.unfocusedInactiveForeground", "normal.black"),
+
+    # ===== PANEL =====
+    ("panel.background", "panel_bg"),
+    ("panel.foreground", "fg"),
+    ("panel.border", "border_color"),
+    ("panelTitle.activeForeground", "fg"),
+    ("panelTitle.inactiveForeground", "normal.black"),
+    ("panelTitle.activeBorder", "normal.blue"),
+
+    # ===== TERMINAL =====
+    ("terminal.background", "bg"),
+    ("terminal.foreground", "fg"),
+    ("terminal.ansiBlack", "normal.black"),
+    ("terminal.ansiRed", "normal.red"),
+    ("terminal.ansiGreen", "normal.green"),
+    ("terminal.ansiYellow", "normal.yellow"),
+    ("terminal.ansiBlue", "normal.blue"),
+    ("terminal.ansiMagenta", "normal.magenta"),
+    ("terminal.ansiCyan", "normal.cyan"),
+    ("terminal.ansiWhite", "normal.white"),
+    ("terminal.ansiBrightBlack", "bright.black"),
+    ("terminal.ansiBrightRed", "bright.red"),
+    ("terminal.ansiBrightGreen", "bright.green"),
+    ("terminal.ansiBrightYellow", "bright.yellow"),
+    ("terminal.ansiBrightBlue", "bright.blue"),
+    ("terminal.ansiBrightMagenta", "bright.magenta"),
+    ("terminal.ansiBrightCyan", "bright.cyan"),
+    ("terminal.ansiBrightWhite", "bright.white"),
+    ("terminal.border", "border_color"),
+    ("terminalCursor.background", "cursor"),
+    ("terminalCursor.foreground", "bg"),
+
+    # ===== INPUT =====
+    ("input.background", "input_bg"),
+    ("input.foreground", "fg"),
+    ("input.border", "border_color"),
+    ("input.placeholderForeground", "normal.black"),
+    ("inputOption.activeBorder", "normal.blue"),
+    ("inputValidation.infoBackground", "normal.blue"),
+    ("inputValidation.infoBorder", "normal.blue"),
+    ("inputValidation.warningBackground", "normal.yellow"),
+    ("inputValidation.warningBorder", "normal.yellow"),
+    ("inputValidation.errorBackground", "normal.red"),
+    ("inputValidation.errorBorder", "normal.red"),
+
+    # ===== DROPDOWN =====
+    ("dropdown.background", "input_bg"),
+    ("dropdown.foreground", "fg"),
+    ("dropdown.border", "border_color"),
+    ("dropdown.listBackground", "input_bg"),
+
+    # ===== LISTS =====
+    ("list.activeSelectionBackground", "list_bg"),
+    ("list.activeSelectionForeground", "fg"),
+    ("list.hoverBackground", "hover_bg"),
+    ("list.hoverForeground", "fg"),
+    ("list.focusBackground", "list_bg"),
+    ("list.focusForeground", "fg"),
+    ("list.inactiveSelectionBackground", "list_bg"),
+    ("list.inactiveSelectionForeground", "fg"),
+    ("list.inactiveFocusBackground", "list_bg"),
+    ("list.inactiveFocusForeground", "fg"),
+    ("list.warningForeground", "normal.yellow"),
+    ("list.errorForeground", "normal.red"),
+    ("list.infoForeground", "normal.blue"),
+    ("list.highlightForeground", "normal.blue"),
+    ("list.deemphasizedForeground", "normal.black"),
+
+    # ===== AI COMPONENTS =====
+    # AI prompt interfaces
+    ("ai-prompt-bar.background", "input_bg"),
+    ("ai-prompt-bar.foreground", "fg"),
+    ("ai-prompt-bar.border", "normal.blue"),
+    ("ai-prompt-bar.button.background", "list_bg"),
+    ("ai-prompt-bar.button.foreground", "fg"),
+    ("ai-prompt-bar.button.hoverBackground", "hover_bg"),
+    ("ai-prompt-bar.button.keep.background", "normal.green"),
+    ("ai-prompt-bar.button.keep.foreground", "bg"),
+
+    # ===== CHAT INTERFACE =====
+    ("chat.background", "side_bg"),
+    ("chat.foreground", "fg"),
+    ("chat.border", "normal.blue"),
+    ("chat.requestBackground", "input_bg"),
+    ("chat.responseBackground", "list_bg"),
+
+    # ===== BUTTONS =====
+    ("button.background", "input_bg"),
+    ("button.foreground", "fg"),
+    ("button.hoverBackground", "hover_bg"),
+    ("button.border", "border_color"),
+    ("button.secondaryBackground", "panel_bg"),
+    ("button.secondaryForeground", "fg"),
+    ("button.secondaryHoverBackground", "hover_bg"),
+    ("button.prominentBackground", "normal.blue"),
+    ("button.prominentForeground", "bg"),
+    ("button.prominentHoverBackground", "bright.blue"),
+
+    # ===== SCROLLBARS =====
+    ("scrollbarSlider.background", "border_color"),
+    ("scrollbarSlider.hoverBackground", "normal.black"),
+    ("scrollbarSlider.activeBackground", "normal.blue"),
+
+    # ===== FOCUS AND BORDERS =====
+    ("focusBorder", "normal.blue"),
+    ("contrastBorder", "border_color"),
+    ("contrastActiveBorder", "normal.blue"),
+
+    # ===== ADDITIONAL UI ELEMENTS =====
+    ("foreground", "fg"),
+    ("disabledForeground", "normal.black"),
+    ("errorForeground", "normal.red"),
+    ("descriptionForeground", "normal.black"),
+
+    # ===== WIDGETS =====
+    ("widget.background", "input_bg"),
+    ("widget.foreground", "fg"),
+    ("widget.border", "border_color"),
+    ("widget.shadow", "widget_shadow"),
+
+    # ===== EDITOR WIDGETS =====
+    ("editorWidget.background", "input_bg"),
+    ("editorWidget.foreground", "fg"),
+    ("editorWidget.border", "border_color"),
+    ("editorWidget.resizeBorder", "normal.blue"),
+
+    # ===== INPUT OPTIONS =====
+    ("inputOption.activeBackground", "normal.blue"),
+    ("inputOption.activeForeground", "bg"),
+    ("inputOption.hoverBackground", "hover_bg"),
+
+    # ===== SELECTION =====
+    ("selection.background", "normal.blue"),
+
+    # ===== EDITOR LINE NUMBERS =====
+    ("editorLineNumber.foreground", "normal.black"),
+    ("editorLineNumber.activeForeground", "fg"),
+    ("editorLineNumber.background", "bg"),
+
+    # ===== ACTION ITEMS AND LABELS =====
+    # Action item menu entries
+    ("actionItem.background", "input_bg"),
+    ("actionItem.foreground", "fg"),
+    ("actionItem.border", "border_color"),
+    ("actionItem.hoverBackground", "hover_bg"),
+    ("actionItem.hoverForeground", "fg"),
+    ("actionItem.activeBackground", "list_bg"),
+    ("actionItem.activeForeground", "fg"),
+    ("actionItem.disabledForeground", "normal.black"),
+
+    # Action labels (button-like elements)
+    ("actionLabel.background", "input_bg"),
+    ("actionLabel.foreground", "fg"),
+    ("actionLabel.border", "border_color"),
+    ("actionLabel.hoverBackground", "hover_bg"),
+    ("actionLabel.hoverForeground", "fg"),
+    ("actionLabel.activeBackground", "list_bg"),
+    ("actionLabel.activeForeground", "fg"),
+    ("actionLabel.disabledForeground", "normal.black"),
+
+    # Menu entries
+    ("menuEntry.background", "input_bg"),
+    ("menuEntry.foreground", "fg"),
+    ("menuEntry.border", "border_color"),
+    ("menuEntry.hoverBackground", "hover_bg"),
+    ("menuEntry.hoverForeground", "fg"),
+    ("menuEntry.activeBackground", "list_bg"),
+    ("menuEntry.activeForeground", "fg"),
+    ("menuEntry.disabledForeground", "normal.black"),
+
+    # Outline elements and icons
+    ("outlineElement.background", "side_bg"),
+    ("outlineElement.foreground", "fg"),
+    ("outlineElement.border", "border_color"),
+    ("outlineElement.hoverBackground", "hover_bg"),
+    ("outlineElement.hoverForeground", "fg"),
+    ("outlineElement.activeBackground", "list_bg"),
+    ("outlineElement.activeForeground", "fg"),
+    ("outlineElement.icon", "normal.blue"),
+    ("outlineElement.activeIcon", "normal.cyan"),
+    ("outlineElement.inactiveIcon", "normal.black"),
+
+    # ===== CODICON ELEMENTS =====
+    # Codicon symbols (outline icons)
+    ("codicon.foreground", "normal.blue"),
+    ("codicon.activeForeground", "normal.cyan"),
+    ("codicon.inactiveForeground", "normal.black"),
+    ("codicon.hoverForeground", "normal.cyan"),
+    ("codicon.disabledForeground", "normal.black"),
+
+    # Specific codicon symbol types
+    ("codicon.symbolClass", "normal.cyan"),
+    ("codicon.symbolMethod", "normal.green"),
+    ("codicon.symbolFunction", "normal.green"),
+    ("codicon.symbolVariable", "normal.blue"),
+    ("codicon.symbolInterface", "normal.cyan"),
+    ("codicon.symbolModule", "normal.cyan"),
+    ("codicon.symbolProperty", "normal.blue"),
+    ("codicon.symbolEnum", "normal.yellow"),
+    ("codicon.symbolKeyword", "normal.magenta"),
+    ("codicon.symbolSnippet", "normal.green"),
+    ("codicon.symbolColor", "normal.magenta"),
+    ("codicon.symbolFile", "normal.cyan"),
+    ("codicon.symbolReference", "normal.blue"),
+    ("codicon.symbolFolder", "normal.blue"),
+    ("codicon.symbolTypeParameter", "normal.cyan"),
+    ("codicon.symbolUnit", "normal.yellow"),
+    ("codicon.symbolValue", "normal.yellow"),
+    ("codicon.symbolStruct", "normal.cyan"),
+    ("codicon.symbolEvent", "normal.red"),
+    ("codicon.symbolOperator", "normal.red"),
+
+    # ===== ICON COLORS =====
+    # General icon colors for various UI elements
+    ("icon.foreground", "normal.blue"),
+    ("icon.activeForeground", "normal.cyan"),
+    ("icon.inactiveForeground", "normal.black"),
+    ("icon.hoverForeground", "normal.cyan"),
+    ("icon.disabledForeground", "normal.black"),
+    ("icon.warningForeground", "normal.yellow"),
+    ("icon.errorForeground", "normal.red"),
+    ("icon.successForeground", "normal.green"),
+    ("icon.infoForeground", "normal.blue"),
+
+    # ===== SYMBOL ICON THEMING =====
+    # Icon theming for various symbol types
+    ("symbolIcon.arrayForeground", "normal.yellow"),
+    ("symbolIcon.booleanForeground", "normal.blue"),
+    ("symbolIcon.classForeground", "normal.cyan"),
+    ("symbolIcon.colorForeground", "normal.magenta"),
+    ("symbolIcon.constantForeground", "normal.yellow"),
+    ("symbolIcon.constructorForeground", "normal.green"),
+    ("symbolIcon.enumeratorForeground", "normal.yellow"),
+    ("symbolIcon.enumeratorMemberForeground", "normal.blue"),
+    ("symbolIcon.eventForeground", "normal.red"),
+    ("symbolIcon.fieldForeground", "normal.blue"),
+    ("symbolIcon.fileForeground", "normal.cyan"),
+    ("symbolIcon.folderForeground", "normal.blue"),
+    ("symbolIcon.functionForeground", "normal.green"),
+    ("symbolIcon.interfaceForeground", "normal.cyan"),
+    ("symbolIcon.keyForeground", "normal.blue"),
+    ("symbolIcon.keywordForeground", "normal.magenta"),
+    ("symbolIcon.methodForeground", "normal.green"),
+    ("symbolIcon.moduleForeground", "normal.cyan"),
+    ("symbolIcon.namespaceForeground", "normal.cyan"),
+    ("symbolIcon.nullForeground", "normal.red"),
+    ("symbolIcon.numberForeground", "normal.yellow"),
+    ("symbolIcon.objectForeground", "normal.blue"),
+    ("symbolIcon.operatorForeground", "normal.red"),
+    ("symbolIcon.packageForeground", "normal.cyan"),
+    ("symbolIcon.propertyForeground", "normal.blue"),
+    ("symbolIcon.referenceForeground", "normal.blue"),
+    ("symbolIcon.snippetForeground", "normal.green"),
+    ("symbolIcon.stringForeground", "normal.green"),
+    ("symbolIcon.structForeground", "normal.cyan"),
+    ("symbolIcon.textForeground", "fg"),
+    ("symbolIcon.typeParameterForeground", "normal.cyan"),
+    ("symbolIcon.unitForeground", "normal.yellow"),
+    ("symbolIcon.variableForeground", "normal.blue"),
+
+    # ===== DEBUG ICONS =====
+    ("debugIcon.startForeground", "normal.green"),
+    ("debugIcon.pauseForeground", "normal.yellow"),
+    ("debugIcon.stopForeground", "normal.red"),
+    ("debugIcon.disconnectForeground", "normal.red"),
+    ("debugIcon.restartForeground", "normal.green"),
+    ("debugIcon.stepOverForeground", "normal.blue"),
+    ("debugIcon.stepIntoForeground", "normal.blue"),
+    ("debugIcon.stepOutForeground", "normal.blue"),
+    ("debugIcon.continueForeground", "normal.green"),
+    ("debugIcon.stepBackForeground", "normal.blue"),
+
+    # ===== PROBLEM ICONS =====
+    ("problemsErrorIcon.foreground", "normal.red"),
+    ("problemsWarningIcon.foreground", "normal.yellow"),
+    ("problemsInfoIcon.foreground", "normal.blue"),
+
+    # ===== TREE ICONS =====
+    ("tree.expandIcon", "normal.blue"),
+    ("tree.collapseIcon", "normal.blue"),
+
+    # ===== COMMENTS ICONS =====
+    ("commentsView.resolvedIcon", "normal.green"),
+    ("commentsView.unresolvedIcon", "normal.blue"),
+)
+
+# Template split into its keys and a C-level getter returning the matching palette values
+_TEMPLATE_KEYS = tuple(key for key, _ in VSCODE_COLOR_TEMPLATE)
+_template_values = operator.itemgetter(*(token for _, token in VSCODE_COLOR_TEMPLATE))
+
+# Syntax highlighting rules as (textMate scopes, palette token) pairs
+VSCODE_TOKEN_RULES = (
+    (("comment", "punctuation.definition.comment", "comment.line", "comment.block"), "normal.black"),
+    (("string", "string.quoted", "string.quoted.single", "string.quoted.double"), "normal.green"),
+    (("constant.numeric", "constant.numeric.integer", "constant.numeric.float"), "normal.yellow"),
+    (("constant.language", "constant.character", "constant.character.escape"), "normal.red"),
+    (("variable", "variable.other", "variable.parameter"), "fg"),
+    (("keyword", "storage.type", "storage.modifier", "storage.class"), "normal.magenta"),
+    (("entity.name.function", "support.function", "meta.function-call"), "normal.blue"),
+    (("entity.name.class", "entity.name.type", "support.class"), "normal.cyan"),
+    (("entity.name.tag", "support.type"), "normal.green"),
+    (("punctuation.definition.string", "punctuation.definition.parameters"), "normal.black"),
+)
+
 def generate_vscode_theme(theme_name, colors):
-    """Generate a VS Code theme from colors"""
+    """Generate a VS Code theme from colors already completed by validate_and_fix_colors"""
+    
+    # Extract base colors
+    bg = colors['background']
+    fg = colors['foreground']
+    normal = colors['normal']
+    bright = colors['bright']
     
     # Determine if this is a light or dark theme
-    is_light = is_light_theme(colors.get('background', '#1e1e2e'))
+    is_light = is_light_theme(bg)
     
-    # Extract base colors
-    bg = colors.get('background', '#1e1e2e')
-    fg = colors.get('foreground', '#cdd6f4')
-    normal = colors.get('normal', {})
-    bright = colors.get('bright', {})
-    cursor = colors.get('cursor', fg)
+    # Resolve every color the template can reference, once per theme
+    palette = {
+        'bg': bg,
+        'fg': fg,
+        'cursor': colors['cursor'],
+        'unnecessary_code_opacity': "0.4",
+        'widget_shadow': "#00000040",
+    }
+    for name in TERMINAL_COLOR_NAMES:
+        palette['normal.' + name] = normal[name]
+        palette['bright.' + name] = bright[name]
     
     # Generate UI colors
-    ui_colors = generate_ui_colors(colors, is_light)
+    palette.update(generate_ui_colors(colors, is_light))
     
     # Create theme covering all UI elements
     theme = {
         "workbench.colorTheme": theme_name,
-        "workbench.colorCustomizations": {
-            # ===== EDITOR =====
-            "editor.background": bg,
-            "editor.foreground": fg,
-            "editor.emptyBackground": bg,
-            "editor.lineHighlightBackground": ui_colors['list_bg'],
-            "editor.selectionBackground": ui_colors['tab_bg'],
-            "editor.findMatchBackground": normal.get('green', '#50fa7b'),
-            "editor.findMatchHighlightBackground": ui_colors['hover_bg'],
-            "editorCursor.foreground": cursor,
-            "editorWhitespace.foreground": normal.get('black', '#6272a4'),
-            "editorIndentGuide.background": ui_colors['border_color'],
-            "editorIndentGuide.activeBackground": normal.get('green', '#50fa7b'),
-            "editor.lineHighlightBorder": ui_colors['border_color'],
-            "editor.rangeHighlightBackground": ui_colors['hover_bg'],
-            "editor.symbolHighlightBackground": ui_colors['hover_bg'],
-            "editor.wordHighlightBackground": ui_colors['hover_bg'],
-            "editor.wordHighlightStrongBackground": ui_colors['tab_bg'],
-            "editorBracketMatch.background": ui_colors['border_color'],
-            "editorBracketMatch.border": normal.get('blue', '#8be9fd'),
-            "editorCodeLens.foreground": normal.get('black', '#6272a4'),
-            "editorError.foreground": normal.get('red', '#ff5555'),
-            "editorWarning.foreground": normal.get('yellow', '#f1fa8c'),
-            "editorInfo.foreground": normal.get('blue', '#8be9fd'),
-            "editorHint.foreground": normal.get('green', '#50fa7b'),
-            "editorGutter.background": bg,
-            "editorGutter.modifiedBackground": normal.get('yellow', '#f1fa8c'),
-            "editorGutter.addedBackground": normal.get('green', '#50fa7b'),
-            "editorGutter.deletedBackground": normal.get('red', '#ff5555'),
-            "editorUnnecessaryCode.opacity": "0.4",
-            "editorSuggestWidget.background": ui_colors['input_bg'],
-            "editorSuggestWidget.border": ui_colors['border_color'],
-            "editorSuggestWidget.selectedBackground": ui_colors['list_bg'],
-            "editorSuggestWidget.highlightForeground": normal.get('blue', '#8be9fd'),
-            "editorHoverWidget.background": ui_colors['input_bg'],
-            "editorHoverWidget.border": ui_colors['border_color'],
-            
-            # ===== EDITOR GROUP =====
-            "editorGroup.background": bg,
-            "editorGroup.border": ui_colors['border_color'],
-            "editorGroupHeader.background": ui_colors['side_bg'],
-            "editorGroupHeader.tabsBackground": ui_colors['side_bg'],
-            "editorGroupHeader.tabsBorder": ui_colors['border_color'],
-            "editorGroupHeader.noTabsBackground": ui_colors['side_bg'],
-            
-            # ===== BREADCRUMBS =====
-            "breadcrumb.background": bg,
-            "breadcrumb.foreground": fg,
-            "breadcrumb.focusForeground": normal.get('blue', '#8be9fd'),
-            "breadcrumb.activeSelectionForeground": fg,
-            "breadcrumbPicker.background": ui_colors['input_bg'],
-            "breadcrumbPicker.foreground": fg,
-            
-            # ===== SIDEBAR =====
-            "sideBar.background": ui_colors['side_bg'],
-            "sideBar.foreground": fg,
-            "sideBarTitle.foreground": fg,
-            "sideBarSectionHeader.background": ui_colors['border_color'],
-            "sideBarSectionHeader.foreground": fg,
-            
-            # ===== ACTIVITY BAR =====
-            "activityBar.background": ui_colors['side_bg'],
-            "activityBar.foreground": fg,
-            "activityBar.activeBorder": normal.get('blue', '#8be9fd'),
-            "activityBar.activeBackground": ui_colors['hover_bg'],
-            "activityBar.inactiveForeground": normal.get('black', '#6272a4'),
-            "activityBarBadge.background": normal.get('red', '#ff5555'),
-            "activityBarBadge.foreground": bg,
-            
-            # ===== STATUS BAR =====
-            "statusBar.background": ui_colors['side_bg'],
-            "statusBar.foreground": fg,
-            "statusBar.debuggingBackground": normal.get('red', '#ff5555'),
-            "statusBar.debuggingForeground": fg,
-            "statusBar.noFolderBackground": ui_colors['side_bg'],
-            "statusBar.noFolderForeground": fg,
-            "statusBarItem.prominentBackground": ui_colors['tab_bg'],
-            "statusBarItem.prominentForeground": fg,
-            "statusBarItem.hoverBackground": ui_colors['hover_bg'],
-            "statusBarItem.errorBackground": normal.get('red', '#ff5555'),
-            "statusBarItem.errorForeground": fg,
-            "statusBarItem.warningBackground": normal.get('yellow', '#f1fa8c'),
-            "statusBarItem.warningForeground": bg,
-            
-            # ===== TITLE BAR =====
-            "titleBar.activeBackground": ui_colors['side_bg'],
-            "titleBar.activeForeground": fg,
-            "titleBar.inactiveBackground": ui_colors['panel_bg'],
-            "titleBar.inactiveForeground": normal.get('black', '#6272a4'),
-            
-            # ===== TABS =====
-            "tab.activeBackground": ui_colors['tab_bg'],
-            "tab.activeForeground": fg,
-            "tab.inactiveBackground": ui_colors['side_bg'],
-            "tab.inactiveForeground": normal.get('black', '#6272a4'),
-            "tab.border": ui_colors['border_color'],
-            "tab.activeBorder": normal.get('blue', '#8be9fd'),
-            "tab.hoverBackground": ui_colors['hover_bg'],
-            "tab.hoverForeground": fg,
-            "tab.unfocusedActiveBackground": ui_colors['tab_bg'],
-            "tab.unfocusedActiveForeground": normal.get('black', '#6272a4'),
-            "tab.unfocusedInactiveBackground": ui_colors['side_bg'],
-            "tab.unfocusedInactiveForeground": normal.get('black', '#6272a4'),
-            
-            # ===== PANEL =====
-            "panel.background": ui_colors['panel_bg'],
-            "panel.foreground": fg,
-            "panel.border": ui_colors['border_color'],
-            "panelTitle.activeForeground": fg,
-            "panelTitle.inactiveForeground": normal.get('black', '#6272a4'),
-            "panelTitle.activeBorder": normal.get('blue', '#8be9fd'),
-            
-            # ===== TERMINAL =====
-            "terminal.background": bg,
-            "terminal.foreground": fg,
-            "terminal.ansiBlack": normal.get('black', '#000000'),
-            "terminal.ansiRed": normal.get('red', '#ff5555'),
-            "terminal.ansiGreen": normal.get('green', '#50fa7b'),
-            "terminal.ansiYellow": normal.get('yellow', '#f1fa8c'),
-            "terminal.ansiBlue": normal.get('blue', '#bd93f9'),
-            "terminal.ansiMagenta": normal.get('magenta', '#ff79c6'),
-            "terminal.ansiCyan": normal.get('cyan', '#8be9fd'),
-            "terminal.ansiWhite": normal.get('white', '#f8f8f2'),
-            "terminal.ansiBrightBlack": bright.get('black', '#6272a4'),
-            "terminal.ansiBrightRed": bright.get('red', '#ff6e6e'),
-            "terminal.ansiBrightGreen": bright.get('green', '#69ff94'),
-            "terminal.ansiBrightYellow": bright.get('yellow', '#ffffa5'),
-            "terminal.ansiBrightBlue": bright.get('blue', '#d6acff'),
-            "terminal.ansiBrightMagenta": bright.get('magenta', '#ff92df'),
-            "terminal.ansiBrightCyan": bright.get('cyan', '#a4ffff'),
-            "terminal.ansiBrightWhite": bright.get('white', '#ffffff'),
-            "terminal.border": ui_colors['border_color'],
-            "terminalCursor.background": cursor,
-            "terminalCursor.foreground": bg,
-            
-            # ===== INPUT =====
-            "input.background": ui_colors['input_bg'],
-            "input.foreground": fg,
-            "input.border": ui_colors['border_color'],
-            "input.placeholderForeground": normal.get('black', '#6272a4'),
-            "inputOption.activeBorder": normal.get('blue', '#8be9fd'),
-            "inputValidation.infoBackground": normal.get('blue', '#8be9fd'),
-            "inputValidation.infoBorder": normal.get('blue', '#8be9fd'),
-            "inputValidation.warningBackground": normal.get('yellow', '#f1fa8c'),
-            "inputValidation.warningBorder": normal.get('yellow', '#f1fa8c'),
-            "inputValidation.errorBackground": normal.get('red', '#ff5555'),
-            "inputValidation.errorBorder": normal.get('red', '#ff5555'),
-            
-            # ===== DROPDOWN =====
-            "dropdown.background": ui_colors['input_bg'],
-            "dropdown.foreground": fg,
-            "dropdown.border": ui_colors['border_color'],
-            "dropdown.listBackground": ui_colors['input_bg'],
-            
-            # ===== LISTS =====
-            "list.activeSelectionBackground": ui_colors['list_bg'],
-            "list.activeSelectionForeground": fg,
-            "list.hoverBackground": ui_colors['hover_bg'],
-            "list.hoverForeground": fg,
-            "list.focusBackground": ui_colors['list_bg'],
-            "list.focusForeground": fg,
-            "list.inactiveSelectionBackground": ui_colors['list_bg'],
-            "list.inactiveSelectionForeground": fg,
-            "list.inactiveFocusBackground": ui_colors['list_bg'],
-            "list.inactiveFocusForeground": fg,
-            "list.warningForeground": normal.get('yellow', '#f1fa8c'),
-            "list.errorForeground": normal.get('red', '#ff5555'),
-            "list.infoForeground": normal.get('blue', '#8be9fd'),
-            "list.highlightForeground": normal.get('blue', '#8be9fd'),
-            "list.deemphasizedForeground": normal.get('black', '#6272a4'),
-            
-            # ===== AI COMPONENTS =====
-            # AI prompt interfaces
-            "ai-prompt-bar.background": ui_colors['input_bg'],
-            "ai-prompt-bar.foreground": fg,
-            "ai-prompt-bar.border": normal.get('blue', '#8be9fd'),
-            "ai-prompt-bar.button.background": ui_colors['list_bg'],
-            "ai-prompt-bar.button.foreground": fg,
-            "ai-prompt-bar.button.hoverBackground": ui_colors['hover_bg'],
-            "ai-prompt-bar.button.keep.background": normal.get('green', '#50fa7b'),
-            "ai-prompt-bar.button.keep.foreground": bg,
-            
-            # ===== CHAT INTERFACE =====
-            "chat.background": ui_colors['side_bg'],
-            "chat.foreground": fg,
-            "chat.border": normal.get('blue', '#8be9fd'),
-            "chat.requestBackground": ui_colors['input_bg'],
-            "chat.responseBackground": ui_colors['list_bg'],
-            
-            # ===== BUTTONS =====
-            "button.background": ui_colors['input_bg'],
-            "button.foreground": fg,
-            "button.hoverBackground": ui_colors['hover_bg'],
-            "button.border": ui_colors['border_color'],
-            "button.secondaryBackground": ui_colors['panel_bg'],
-            "button.secondaryForeground": fg,
-            "button.secondaryHoverBackground": ui_colors['hover_bg'],
-            "button.prominentBackground": normal.get('blue', '#8be9fd'),
-            "button.prominentForeground": bg,
-            "button.prominentHoverBackground": bright.get('blue', '#d6acff'),
-            
-            # ===== SCROLLBARS =====
-            "scrollbarSlider.background": ui_colors['border_color'],
-            "scrollbarSlider.hoverBackground": normal.get('black', '#6272a4'),
-            "scrollbarSlider.activeBackground": normal.get('blue', '#8be9fd'),
-            
-            # ===== FOCUS AND BORDERS =====
-            "focusBorder": normal.get('blue', '#8be9fd'),
-            "contrastBorder": ui_colors['border_color'],
-            "contrastActiveBorder": normal.get('blue', '#8be9fd'),
-            
-            # ===== ADDITIONAL UI ELEMENTS =====
-            "foreground": fg,
-            "disabledForeground": normal.get('black', '#6272a4'),
-            "errorForeground": normal.get('red', '#ff5555'),
-            "descriptionForeground": normal.get('black', '#6272a4'),
-            
-            # ===== WIDGETS =====
-            "widget.background": ui_colors['input_bg'],
-            "widget.foreground": fg,
-            "widget.border": ui_colors['border_color'],
-            "widget.shadow": "#00000040",
-            
-            # ===== EDITOR WIDGETS =====
-            "editorWidget.background": ui_colors['input_bg'],
-            "editorWidget.foreground": fg,
-            "editorWidget.border": ui_colors['border_color'],
-            "editorWidget.resizeBorder": normal.get('blue', '#8be9fd'),
-            
-            # ===== INPUT OPTIONS =====
-            "inputOption.activeBackground": normal.get('blue', '#8be9fd'),
-            "inputOption.activeForeground": bg,
-            "inputOption.activeBorder": normal.get('blue', '#8be9fd'),
-            "inputOption.hoverBackground": ui_colors['hover_bg'],
-            
-            # ===== SELECTION =====
-            "selection.background": normal.get('blue', '#8be9fd'),
-            
-            # ===== EDITOR LINE NUMBERS =====
-            "editorLineNumber.foreground": normal.get('black', '#6272a4'),
-            "editorLineNumber.activeForeground": fg,
-            "editorLineNumber.background": bg,
-            
-            # ===== ACTION ITEMS AND LABELS =====
-            # Action item menu entries
-            "actionItem.background": ui_colors['input_bg'],
-            "actionItem.foreground": fg,
-            "actionItem.border": ui_colors['border_color'],
-            "actionItem.hoverBackground": ui_colors['hover_bg'],
-            "actionItem.hoverForeground": fg,
-            "actionItem.activeBackground": ui_colors['list_bg'],
-            "actionItem.activeForeground": fg,
-            "actionItem.disabledForeground": normal.get('black', '#6272a4'),
-            
-            # Action labels (button-like elements)
-            "actionLabel.background": ui_colors['input_bg'],
-            "actionLabel.foreground": fg,
-            "actionLabel.border": ui_colors['border_color'],
-            "actionLabel.hoverBackground": ui_colors['hover_bg'],
-            "actionLabel.hoverForeground": fg,
-            "actionLabel.activeBackground": ui_colors['list_bg'],
-            "actionLabel.activeForeground": fg,
-            "actionLabel.disabledForeground": normal.get('black', '#6272a4'),
-            
-            # Menu entries
-            "menuEntry.background": ui_colors['input_bg'],
-            "menuEntry.foreground": fg,
-            "menuEntry.border": ui_colors['border_color'],
-            "menuEntry.hoverBackground": ui_colors['hover_bg'],
-            "menuEntry.hoverForeground": fg,
-            "menuEntry.activeBackground": ui_colors['list_bg'],
-            "menuEntry.activeForeground": fg,
-            "menuEntry.disabledForeground": normal.get('black', '#6272a4'),
-            
-            # Outline elements and icons
-            "outlineElement.background": ui_colors['side_bg'],
-            "outlineElement.foreground": fg,
-            "outlineElement.border": ui_colors['border_color'],
-            "outlineElement.hoverBackground": ui_colors['hover_bg'],
-            "outlineElement.hoverForeground": fg,
-            "outlineElement.activeBackground": ui_colors['list_bg'],
-            "outlineElement.activeForeground": fg,
-            "outlineElement.icon": normal.get('blue', '#8be9fd'),
-            "outlineElement.activeIcon": normal.get('cyan', '#8be9fd'),
-            "outlineElement.inactiveIcon": normal.get('black', '#6272a4'),
-            
-            # ===== CODICON ELEMENTS =====
-            # Codicon symbols (outline icons)
-            "codicon.foreground": normal.get('blue', '#8be9fd'),
-            "codicon.activeForeground": normal.get('cyan', '#8be9fd'),
-            "codicon.inactiveForeground": normal.get('black', '#6272a4'),
-            "codicon.hoverForeground": normal.get('cyan', '#8be9fd'),
-            "codicon.disabledForeground": normal.get('black', '#6272a4'),
-            
-            # Specific codicon symbol types
-            "codicon.symbolClass": normal.get('cyan', '#8be9fd'),
-            "codicon.symbolMethod": normal.get('green', '#50fa7b'),
-            "codicon.symbolFunction": normal.get('green', '#50fa7b'),
-            "codicon.symbolVariable": normal.get('blue', '#8be9fd'),
-            "codicon.symbolInterface": normal.get('cyan', '#8be9fd'),
-            "codicon.symbolModule": normal.get('cyan', '#8be9fd'),
-            "codicon.symbolProperty": normal.get('blue', '#8be9fd'),
-            "codicon.symbolEnum": normal.get('yellow', '#f1fa8c'),
-            "codicon.symbolKeyword": normal.get('magenta', '#ff79c6'),
-            "codicon.symbolSnippet": normal.get('green', '#50fa7b'),
-            "codicon.symbolColor": normal.get('magenta', '#ff79c6'),
-            "codicon.symbolFile": normal.get('cyan', '#8be9fd'),
-            "codicon.symbolReference": normal.get('blue', '#8be9fd'),
-            "codicon.symbolFolder": normal.get('blue', '#8be9fd'),
-            "codicon.symbolTypeParameter": normal.get('cyan', '#8be9fd'),
-            "codicon.symbolUnit": normal.get('yellow', '#f1fa8c'),
-            "codicon.symbolValue": normal.get('yellow', '#f1fa8c'),
-            "codicon.symbolEnum": normal.get('yellow', '#f1fa8c'),
-            "codicon.symbolStruct": normal.get('cyan', '#8be9fd'),
-            "codicon.symbolEvent": normal.get('red', '#ff5555'),
-            "codicon.symbolOperator": normal.get('red', '#ff5555'),
-            "codicon.symbolTypeParameter": normal.get('cyan', '#8be9fd'),
-            
-            # ===== ICON COLORS =====
-            # General icon colors for various UI elements
-            "icon.foreground": normal.get('blue', '#8be9fd'),
-            "icon.activeForeground": normal.get('cyan', '#8be9fd'),
-            "icon.inactiveForeground": normal.get('black', '#6272a4'),
-            "icon.hoverForeground": normal.get('cyan', '#8be9fd'),
-            "icon.disabledForeground": normal.get('black', '#6272a4'),
-            "icon.warningForeground": normal.get('yellow', '#f1fa8c'),
-            "icon.errorForeground": normal.get('red', '#ff5555'),
-            "icon.successForeground": normal.get('green', '#50fa7b'),
-            "icon.infoForeground": normal.get('blue', '#8be9fd'),
-            
-            # ===== SYMBOL ICON THEMING =====
-            # Icon theming for various symbol types
-            "symbolIcon.arrayForeground": normal.get('yellow', '#f1fa8c'),
-            "symbolIcon.booleanForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.classForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.colorForeground": normal.get('magenta', '#ff79c6'),
-            "symbolIcon.constantForeground": normal.get('yellow', '#f1fa8c'),
-            "symbolIcon.constructorForeground": normal.get('green', '#50fa7b'),
-            "symbolIcon.enumeratorForeground": normal.get('yellow', '#f1fa8c'),
-            "symbolIcon.enumeratorMemberForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.eventForeground": normal.get('red', '#ff5555'),
-            "symbolIcon.fieldForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.fileForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.folderForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.functionForeground": normal.get('green', '#50fa7b'),
-            "symbolIcon.interfaceForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.keyForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.keywordForeground": normal.get('magenta', '#ff79c6'),
-            "symbolIcon.methodForeground": normal.get('green', '#50fa7b'),
-            "symbolIcon.moduleForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.namespaceForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.nullForeground": normal.get('red', '#ff5555'),
-            "symbolIcon.numberForeground": normal.get('yellow', '#f1fa8c'),
-            "symbolIcon.objectForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.operatorForeground": normal.get('red', '#ff5555'),
-            "symbolIcon.packageForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.propertyForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.referenceForeground": normal.get('blue', '#8be9fd'),
-            "symbolIcon.snippetForeground": normal.get('green', '#50fa7b'),
-            "symbolIcon.stringForeground": normal.get('green', '#50fa7b'),
-            "symbolIcon.structForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.textForeground": fg,
-            "symbolIcon.typeParameterForeground": normal.get('cyan', '#8be9fd'),
-            "symbolIcon.unitForeground": normal.get('yellow', '#f1fa8c'),
-            "symbolIcon.variableForeground": normal.get('blue', '#8be9fd'),
-            
-            # ===== DEBUG ICONS =====
-            "debugIcon.startForeground": normal.get('green', '#50fa7b'),
-            "debugIcon.pauseForeground": normal.get('yellow', '#f1fa8c'),
-            "debugIcon.stopForeground": normal.get('red', '#ff5555'),
-            "debugIcon.disconnectForeground": normal.get('red', '#ff5555'),
-            "debugIcon.restartForeground": normal.get('green', '#50fa7b'),
-            "debugIcon.stepOverForeground": normal.get('blue', '#8be9fd'),
-            "debugIcon.stepIntoForeground": normal.get('blue', '#8be9fd'),
-            "debugIcon.stepOutForeground": normal.get('blue', '#8be9fd'),
-            "debugIcon.continueForeground": normal.get('green', '#50fa7b'),
-            "debugIcon.stepBackForeground": normal.get('blue', '#8be9fd'),
-            
-            # ===== PROBLEM ICONS =====
-            "problemsErrorIcon.foreground": normal.get('red', '#ff5555'),
-            "problemsWarningIcon.foreground": normal.get('yellow', '#f1fa8c'),
-            "problemsInfoIcon.foreground": normal.get('blue', '#8be9fd'),
-            
-            # ===== TREE ICONS =====
-            "tree.expandIcon": normal.get('blue', '#8be9fd'),
-            "tree.collapseIcon": normal.get('blue', '#8be9fd'),
-            
-            # ===== COMMENTS ICONS =====
-            "commentsView.resolvedIcon": normal.get('green', '#50fa7b'),
-            "commentsView.unresolvedIcon": normal.get('blue', '#8be9fd'),
-        },
+        "workbench.colorCustomizations": dict(zip(_TEMPLATE_KEYS, _template_values(palette))),
         "editor.tokenColorCustomizations": {
             "textMateRules": [
-                {
-                    "scope": ["comment", "punctuation.definition.comment", "comment.line", "comment.block"],
-                    "settings": {
-                        "foreground": normal.get('black', '#6272a4')
-                    }
-                },
-                {
-                    "scope": ["string", "string.quoted", "string.quoted.single", "string.quoted.double"],
-                    "settings": {
-                        "foreground": normal.get('green', '#50fa7b')
-                    }
-                },
-                {
-                    "scope": ["constant.numeric", "constant.numeric.integer", "constant.numeric.float"],
-                    "settings": {
-                        "foreground": normal.get('yellow', '#f1fa8c')
-                    }
-                },
-                {
-                    "scope": ["constant.language", "constant.character", "constant.character.escape"],
-                    "settings": {
-                        "foreground": normal.get('red', '#ff5555')
-                    }
-                },
-                {
-                    "scope": ["variable", "variable.other", "variable.parameter"],
-                    "settings": {
-                        "foreground": fg
-                    }
-                },
-                {
-                    "scope": ["keyword", "storage.type", "storage.modifier", "storage.class"],
-                    "settings": {
-                        "foreground": normal.get('magenta', '#ff79c6')
-                    }
-                },
-                {
-                    "scope": ["entity.name.function", "support.function", "meta.function-call"],
-                    "settings": {
-                        "foreground": normal.get('blue', '#8be9fd')
-                    }
-                },
-                {
-                    "scope": ["entity.name.class", "entity.name.type", "support.class"],
-                    "settings": {
-                        "foreground": normal.get('cyan', '#8be9fd')
-                    }
-                },
-                {
-                    "scope": ["entity.name.tag", "support.type"],
-                    "settings": {
-                        "foreground": normal.get('green', '#50fa7b')
-                    }
-                },
-                {
-                    "scope": ["punctuation.definition.string", "punctuation.definition.parameters"],
-                    "settings": {
-                        "foreground": normal.get('black', '#6272a4')
-                    }
-                }
+                {"scope": scopes, "settings": {"foreground": palette[token]}}
+                for scopes, token in VSCODE_TOKEN_RULES
             ]
         }
     }
     
     return theme
 
-def generate_theme_for_name(theme_name, themes_dir=None):
-    """Generate theme for a specific theme name"""
+def _enable_orjson():
+    """Serialize with orjson from now on, if it is installed"""
+    global _orjson
+    try:
+        import orjson
+    except ImportError:
+        return
+    _orjson = orjson
+
+def _dump_theme_json(theme):
+    """Serialize a theme as 2-space indented JSON bytes, using orjson once it is enabled"""
+    if _orjson is not None:
+        return _orjson.dumps(theme, option=_orjson.OPT_INDENT_2)
+    return json.dumps(theme, indent=2).encode()
+
+@lru_cache(maxsize=None)
+def _generator_digest():
+    """Digest of this generator's source, so any change to it invalidates sync hashes"""
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+def _theme_input_hash(alacritty_file):
+    """Hash an alacritty.toml together with the generator that turns it into a theme"""
+    h = hashlib.blake2b(_generator_digest(), digest_size=16)
+    h.update(alacritty_file.read_bytes())
+    return h.hexdigest()
+
+def generate_theme_for_name(theme_name, themes_dir=None, force=False):
+    """Generate theme for a specific theme name, skipping it if its inputs are unchanged"""
     if themes_dir is None:
-        themes_dir = Path.home() / '.config' / 'omarchy' / 'themes'
+        themes_dir = THEMES_DIR
     else:
         themes_dir = Path(themes_dir)
     
@@ -839,6 +893,19 @@ def generate_theme_for_name(theme_name, themes_dir=None):
         print(f"alacritty.toml not found in theme '{theme_name}'!")
         return False
     
+    theme_sync_file = theme_dir / f'{theme_name}-theme-sync.json'
+    hash_file = theme_dir / f'{theme_name}{SYNC_HASH_SUFFIX}'
+    input_hash = _theme_input_hash(alacritty_file)
+    
+    # Skip themes whose alacritty.toml and generator are unchanged since the last run
+    if not force and theme_sync_file.exists():
+        try:
+            if hash_file.read_text() == input_hash:
+                print(f"✓ Theme up to date: {theme_sync_file}")
+                return True
+        except OSError:
+            pass
+    
     print(f"Generating theme for: {theme_name}")
     
     # Parse colors from alacritty.toml
@@ -857,25 +924,41 @@ def generate_theme_for_name(theme_name, themes_dir=None):
     # Generate VS Code theme
     vscode_theme = generate_vscode_theme(theme_name, colors)
     
-    # Save only the unified theme file
-    theme_sync_file = theme_dir / f'{theme_name}-theme-sync.json'
-    with open(theme_sync_file, 'w') as f:
-        json.dump(vscode_theme, f, indent=2)
+    # Save only the unified theme file, then record the inputs it was built from
+    theme_sync_file.write_bytes(_dump_theme_json(vscode_theme))
+    hash_tmp = hash_file.with_name(hash_file.name + '.tmp')
+    hash_tmp.write_text(input_hash)
+    os.replace(hash_tmp, hash_file)
     
     print(f"✓ Generated theme: {theme_sync_file}")
     print(f"✓ Theme includes {len(vscode_theme['workbench.colorCustomizations'])} color customizations")
     
     # Show theme type
-    is_light = is_light_theme(colors.get('background', '#1e1e2e'))
+    is_light = is_light_theme(colors.get('background', DEFAULT_BACKGROUND))
     theme_type = "LIGHT" if is_light else "DARK"
     print(f"✓ Theme type: {theme_type}")
     
     return True
 
-def generate_all_themes(themes_dir=None):
+def _list_theme_dirs(themes_dir):
+    """List theme directories containing an alacritty.toml, using scandir's cached d_type"""
+    with os.scandir(themes_dir) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, 'alacritty.toml'))]
+
+def _generate_theme_worker(job):
+    """Generate one (theme_name, themes_dir, force) job in a pool worker, returning (success, output)"""
+    theme_name, themes_dir, force = job
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        success = generate_theme_for_name(theme_name, themes_dir, force)
+        print()  # Empty line between themes
+    return success, output.getvalue()
+
+def generate_all_themes(themes_dir=None, force=False):
     """Generate themes for all available themes"""
     if themes_dir is None:
-        themes_dir = Path.home() / '.config' / 'omarchy' / 'themes'
+        themes_dir = THEMES_DIR
     else:
         themes_dir = Path(themes_dir)
     
@@ -885,18 +968,33 @@ def generate_all_themes(themes_dir=None):
         print(f"Themes directory not found: {themes_dir}")
         return False
     
-    theme_dirs = [d for d in themes_dir.iterdir() if d.is_dir() and (d / "alacritty.toml").exists()]
+    theme_dirs = _list_theme_dirs(themes_dir)
     
     if not theme_dirs:
         print("No themes found")
         return False
     
+    if len(theme_dirs) >= ORJSON_MIN_THEMES:
+        _enable_orjson()
+    
     success_count = 0
-    for theme_dir in theme_dirs:
-        theme_name = theme_dir.name
-        if generate_theme_for_name(theme_name, themes_dir):
-            success_count += 1
-        print()  # Empty line between themes
+    workers = min(os.cpu_count() or 1, len(theme_dirs))
+    if len(theme_dirs) >= PARALLEL_MIN_THEMES and workers > 1:
+        # Workers return their output so each theme's report prints unbroken, in order
+        jobs = [(theme_dir.name, str(themes_dir), force) for theme_dir in theme_dirs]
+        # Deferred: multiprocessing costs ~20 ms to import and only large libraries use it
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for success, output in executor.map(_generate_theme_worker, jobs, chunksize=8):
+                sys.stdout.write(output)
+                if success:
+                    success_count += 1
+    else:
+        for theme_dir in theme_dirs:
+            theme_name = theme_dir.name
+            if generate_theme_for_name(theme_name, themes_dir, force):
+                success_count += 1
+            print()  # Empty line between themes
     
     print(f"🎉 Generated themes for {success_count}/{len(theme_dirs)} themes")
     return success_count == len(theme_dirs)
@@ -904,7 +1002,7 @@ def generate_all_themes(themes_dir=None):
 def check_theme_status(themes_dir=None):
     """Check the status of all themes"""
     if themes_dir is None:
-        themes_dir = Path.home() / '.config' / 'omarchy' / 'themes'
+        themes_dir = THEMES_DIR
     else:
         themes_dir = Path(themes_dir)
     
@@ -912,7 +1010,7 @@ def check_theme_status(themes_dir=None):
         print(f"Themes directory not found: {themes_dir}")
         return
     
-    theme_dirs = [d for d in themes_dir.iterdir() if d.is_dir() and (d / "alacritty.toml").exists()]
+    theme_dirs = _list_theme_dirs(themes_dir)
     
     print("🎨 Theme Status Report")
     print("=" * 50)
@@ -937,25 +1035,25 @@ def main():
                       help='Command to run')
     parser.add_argument('theme_name', nargs='?', help='Theme name for generate command')
     parser.add_argument('--themes-dir', type=str, help='Custom themes directory')
+    parser.add_argument('--force', action='store_true', help='Regenerate even if alacritty.toml is unchanged')
     
     args = parser.parse_args()
     
     if args.command == 'generate':
         if not args.theme_name:
             print("Error: Theme name required for generate command")
-            themes_dir = Path(args.themes_dir) if args.themes_dir else Path.home() / '.config' / 'omarchy' / 'themes'
+            themes_dir = Path(args.themes_dir) if args.themes_dir else THEMES_DIR
             if themes_dir.exists():
                 print("Available themes:")
-                for theme_dir in themes_dir.iterdir():
-                    if theme_dir.is_dir() and (theme_dir / "alacritty.toml").exists():
-                        print(f"  - {theme_dir.name}")
+                for theme_dir in _list_theme_dirs(themes_dir):
+                    print(f"  - {theme_dir.name}")
             sys.exit(1)
         
-        success = generate_theme_for_name(args.theme_name, args.themes_dir)
+        success = generate_theme_for_name(args.theme_name, args.themes_dir, args.force)
         sys.exit(0 if success else 1)
     
     elif args.command == 'generate-all':
-        success = generate_all_themes(args.themes_dir)
+        success = generate_all_themes(args.themes_dir, args.force)
         sys.exit(0 if success else 1)
     
     elif args.command == 'status':
@@ -969,13 +1067,13 @@ def main():
         print("  theme_generator.py status")
         print("\nOptions:")
         print("  --themes-dir <path>    Custom themes directory path")
+        print("  --force                Regenerate themes even if unchanged")
         
-        themes_dir = Path(args.themes_dir) if args.themes_dir else Path.home() / '.config' / 'omarchy' / 'themes'
+        themes_dir = Path(args.themes_dir) if args.themes_dir else THEMES_DIR
         if themes_dir.exists():
             print("\nAvailable themes:")
-            for theme_dir in themes_dir.iterdir():
-                if theme_dir.is_dir() and (theme_dir / "alacritty.toml").exists():
-                    print(f"  - {theme_dir.name}")
+            for theme_dir in _list_theme_dirs(themes_dir):
+                print(f"  - {theme_dir.name}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,40 +6,131 @@ Omarchy Theme Sync - Apply themes to VS Code and Cursor
 import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Locations are fixed for the life of the process, so resolve them once
+HOME_DIR = Path.home()
+CURRENT_THEME_LINK = HOME_DIR / '.config' / 'omarchy' / 'current' / 'theme'
+THEMES_DIR = HOME_DIR / '.config' / 'omarchy' / 'themes'
+VSCODE_CONFIG_DIR = HOME_DIR / '.config' / 'Code' / 'User'
+CURSOR_CONFIG_DIR = HOME_DIR / '.config' / 'Cursor' / 'User'
+
+# Present when the user chose --symlink, so every later apply (including the
+# one omarchy-theme-set runs on each switch) keeps linking settings.json
+SYMLINK_MODE_MARKER = HOME_DIR / '.config' / 'omarchy' / 'ide-theme-sync-symlink'
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents atomically so editors never read a partial settings.json"""
+    target = path
+    if path.is_symlink():
+        # Write through symlinks (e.g. dotfile-managed settings), but replace a --symlink
+        # link to a generated theme rather than overwriting that theme
+        resolved = path.resolve()
+        if not resolved.is_relative_to(THEMES_DIR.resolve()):
+            target = resolved
+    tmp = target.with_name(target.name + '.tmp')
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _update_settings(settings_file: Path, data: bytes) -> None:
+    """Write settings.json only if its contents differ, so editors don't reload identical settings"""
+    try:
+        # Compare sizes first so a changed theme is rarely read back
+        if settings_file.stat().st_size == len(data) and settings_file.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    _write_atomic(settings_file, data)
+
+
+def _link_settings(settings_file: Path, theme_file: Path) -> None:
+    """Point settings.json at the generated theme, atomically replacing any file or link"""
+    try:
+        if os.readlink(settings_file) == str(theme_file):
+            return
+    except OSError:
+        pass
+    tmp = settings_file.with_name(settings_file.name + '.tmp')
+    tmp.unlink(missing_ok=True)
+    os.symlink(theme_file, tmp)
+    try:
+        os.replace(tmp, settings_file)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _set_symlink_mode(enabled: bool) -> None:
+    """Persist whether applies link settings.json instead of copying it"""
+    if enabled:
+        SYMLINK_MODE_MARKER.parent.mkdir(parents=True, exist_ok=True)
+        SYMLINK_MODE_MARKER.touch()
+    else:
+        SYMLINK_MODE_MARKER.unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=None)
+def _which(command: str) -> Optional[str]:
+    """Resolve a command on PATH once per process; call _which.cache_clear() after PATH changes"""
+    return shutil.which(command)
+
 
 class EditorThemeApplier:
     """Handles applying themes to different editors"""
     
-    def __init__(self):
-        self.vscode_config_dir = Path.home() / '.config' / 'Code' / 'User'
-        self.cursor_config_dir = Path.home() / '.config' / 'Cursor' / 'User'
+    def __init__(self, use_symlinks: Optional[bool] = None):
+        # Default to the mode saved by the last --symlink / --copy
+        if use_symlinks is None:
+            use_symlinks = SYMLINK_MODE_MARKER.exists()
+        self.use_symlinks = use_symlinks
+        self.vscode_config_dir = VSCODE_CONFIG_DIR
+        self.cursor_config_dir = CURSOR_CONFIG_DIR
     
     def apply_themes(self, theme_name: Optional[str] = None) -> bool:
         """Apply themes to all supported editors"""
         if not theme_name:
-            # Get current theme from symlink
-            current_theme_link = Path.home() / '.config' / 'omarchy' / 'current' / 'theme'
-            if current_theme_link.exists() and current_theme_link.is_symlink():
-                theme_name = current_theme_link.readlink().name
-            else:
+            # Get current theme from symlink; a single readlink also rules out a missing link
+            try:
+                theme_name = os.path.basename(os.readlink(CURRENT_THEME_LINK).rstrip('/'))
+            except OSError:
                 print("❌ No current theme found")
                 return False
         
         print(f"🎨 Applying editor themes for: {theme_name}")
         
-        theme_dir = Path.home() / '.config' / 'omarchy' / 'themes' / theme_name
+        theme_dir = THEMES_DIR / theme_name
         if not theme_dir.exists():
             print(f"❌ Theme directory not found: {theme_dir}")
             return False
         
         success = True
+        vscode_available = self._is_editor_available('code')
+        cursor_available = self._is_editor_available('cursor')
+        
+        # Copies read the theme once for both editors; symlinks only need it to exist
+        theme_file = theme_dir / f'{theme_dir.name}-theme-sync.json'
+        theme_data = None
+        theme_ready = False
+        if vscode_available or cursor_available:
+            if self.use_symlinks:
+                theme_ready = theme_file.is_file()
+                if not theme_ready:
+                    print(f"⚠ Theme file not found: {theme_file}")
+            else:
+                theme_data = self._read_theme_file(theme_file)
+                theme_ready = theme_data is not None
         
         # Apply VS Code theme
-        if self._is_editor_available('code'):
-            if self._apply_vscode_theme(theme_dir):
+        if vscode_available:
+            if theme_ready and self._apply_vscode_theme(theme_file, theme_data):
                 print("✓ Applied VS Code theme")
             else:
                 print("⚠ Failed to apply VS Code theme")
@@ -48,8 +139,8 @@ class EditorThemeApplier:
             print("⚠ VS Code not found")
         
         # Apply Cursor theme
-        if self._is_editor_available('cursor'):
-            if self._apply_cursor_theme(theme_dir):
+        if cursor_available:
+            if theme_ready and self._apply_cursor_theme(theme_file, theme_data):
                 print("✓ Applied Cursor theme")
             else:
                 print("⚠ Failed to apply Cursor theme")
@@ -61,44 +152,48 @@ class EditorThemeApplier:
     
     def _is_editor_available(self, editor_command: str) -> bool:
         """Check if an editor is available in PATH"""
-        return shutil.which(editor_command) is not None
+        return _which(editor_command) is not None
     
-    def _apply_vscode_theme(self, theme_dir: Path) -> bool:
-        """Apply theme to VS Code"""
-        theme_name = theme_dir.name
-        theme_file = theme_dir / f'{theme_name}-theme-sync.json'
-        if not theme_file.exists():
+    def _read_theme_file(self, theme_file: Path) -> Optional[bytes]:
+        """Read a generated theme file"""
+        try:
+            return theme_file.read_bytes()
+        except FileNotFoundError:
             print(f"⚠ Theme file not found: {theme_file}")
-            return False
-        
+        except OSError as e:
+            print(f"❌ Error reading theme file: {e}")
+        return None
+    
+    def _apply_vscode_theme(self, theme_file: Path, theme_data: Optional[bytes]) -> bool:
+        """Apply theme to VS Code"""
         try:
             # Ensure config directory exists
             self.vscode_config_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copy theme file
+            # Write theme settings, or link them to the generated theme
             settings_file = self.vscode_config_dir / 'settings.json'
-            shutil.copy2(theme_file, settings_file)
+            if self.use_symlinks:
+                _link_settings(settings_file, theme_file)
+            else:
+                _update_settings(settings_file, theme_data)
             
             return True
         except Exception as e:
             print(f"❌ Error applying VS Code theme: {e}")
             return False
     
-    def _apply_cursor_theme(self, theme_dir: Path) -> bool:
+    def _apply_cursor_theme(self, theme_file: Path, theme_data: Optional[bytes]) -> bool:
         """Apply theme to Cursor"""
-        theme_name = theme_dir.name
-        theme_file = theme_dir / f'{theme_name}-theme-sync.json'
-        if not theme_file.exists():
-            print(f"⚠ Theme file not found: {theme_file}")
-            return False
-        
         try:
             # Ensure config directory exists
             self.cursor_config_dir.mkdir(parents=True, exist_ok=True)
             
-            # Copy theme file
+            # Write theme settings, or link them to the generated theme
             settings_file = self.cursor_config_dir / 'settings.json'
-            shutil.copy2(theme_file, settings_file)
+            if self.use_symlinks:
+                _link_settings(settings_file, theme_file)
+            else:
+                _update_settings(settings_file, theme_data)
             
             return True
         except Exception as e:
@@ -110,10 +205,18 @@ def main():
     """Main function for standalone usage"""
     import sys
     
+    args = sys.argv[1:]
+    
+    # --symlink / --copy switch the mode for this and every later apply
+    for flag, enabled in (('--symlink', True), ('--copy', False)):
+        if flag in args:
+            args.remove(flag)
+            _set_symlink_mode(enabled)
+    
     applier = EditorThemeApplier()
     
-    if len(sys.argv) > 1:
-        theme_name = sys.argv[1]
+    if args:
+        theme_name = args[0]
         success = applier.apply_themes(theme_name)
     else:
         success = applier.apply_themes()
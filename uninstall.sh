@@ -40,7 +40,10 @@ remove_cli_tool() {
     else
         echo "ℹ️ CLI tool not found (may already be removed)"
     fi
-    
+
+    # Saved --symlink choice from 'omarchy-theme-sync apply'
+    rm -f "$HOME/.config/omarchy/ide-theme-sync-symlink"
+
     echo ""
 }
 